@@ -281,8 +281,15 @@ def print_report(
     print("=" * 80)
 
 
-def main():
-    """Run the docstring coverage check."""
+def main(argv: list[str] | None = None) -> int:
+    """Run the docstring coverage check.
+
+    Args:
+        argv: Command line arguments (default: ``sys.argv[1:]``)
+
+    Returns:
+        Process exit code
+    """
     parser = ArgumentParser(description="Check docstring coverage")
     parser.add_argument("--dir", type=str, default="src", help="Directory to check (default: src)")
     parser.add_argument(
@@ -301,7 +308,7 @@ def main():
         default=0,
         help="Minimum required docstring coverage percentage",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     directory = Path(args.dir)
     if not directory.exists() or not directory.is_dir():
@@ -33,14 +33,15 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 import urllib.error
 import urllib.request
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, MutableMapping
 from dataclasses import dataclass
 from difflib import unified_diff
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 
 import tomlkit
@@ -62,6 +63,8 @@ class Options:
 
 # ---------- TOML helpers ----------
 
+T = TypeVar("T")
+
 
 def _read_doc(path: Path):
     text = path.read_text(encoding="utf-8")
@@ -84,6 +87,18 @@ def _write_or_diff(path: Path, before: str, after: str, check: bool) -> int:
     return 0
 
 
+def _get_or_create(container: MutableMapping[str, Any], key: str, factory: Callable[[], T]) -> T:
+    """Return ``container[key]``, inserting ``factory()`` only when the key is missing.
+
+    Unlike ``container.setdefault(key, factory())`` this does not build a throwaway
+    tomlkit container on every call when the key already exists.
+    """
+    value: T | None = container.get(key)
+    if value is None:
+        value = container.setdefault(key, factory())
+    return value
+
+
 def _layout(doc) -> str:
     # Prefer Poetry if both exist
     if "tool" in doc and isinstance(doc["tool"], dict) and "poetry" in doc["tool"]:
@@ -127,12 +142,14 @@ def _fetch_pypi_versions(name: str, timeout: float) -> dict[str, bool]:
     return versions
 
 
-def _select_latest_version(versions: dict[str, bool], include_prerelease: bool) -> Version | None:
-    """Pick the highest non-yanked Version. If include_prerelease=False, prefer finals."""
+def _parse_versions(versions: Iterable[str], include_prerelease: bool) -> list[Version]:
+    """Parse version strings, dropping invalid ones (and pre-releases unless included).
+
+    *versions* holds the candidate version strings, e.g. the non-yanked keys of the mapping
+    returned by :func:`_fetch_pypi_versions`.
+    """
     valid: list[Version] = []
-    for ver_str, not_yanked in versions.items():
-        if not not_yanked:
-            continue
+    for ver_str in versions:
         try:
             v = Version(ver_str)
         except InvalidVersion:
@@ -140,9 +157,18 @@ def _select_latest_version(versions: dict[str, bool], include_prerelease: bool)
         if (not include_prerelease) and v.is_prerelease:
             continue
         valid.append(v)
-    if not valid:
-        return None
-    return max(valid)
+    return valid
+
+
+def _select_latest_version(versions: Iterable[Version], major: int | None = None) -> Version | None:
+    """Pick the highest of the already-parsed *versions*, optionally only within *major*.
+
+    Taking parsed versions lets a caller make several picks from one release history
+    (e.g. a second pass restricted to *major*) while parsing each version string once.
+    """
+    if major is not None:
+        versions = (v for v in versions if v.major == major)
+    return max(versions, default=None)
 
 
 # ---------- Constraint mapping ----------
@@ -217,6 +243,45 @@ def _respect_major_allowed(current_spec: str | None, latest: Version, allow_majo
 # ---------- Dependency iteration & rewriting ----------
 
 
+# Fast path for the common ``name[extras] specifier ; marker`` requirement shape. Anything it
+# does not recognise (URLs, parenthesised specifiers, ...) falls back to the full PEP 508 parser.
+_REQ_RE = re.compile(
+    r"^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"(?:\[([^\]]*)\])?\s*"
+    r"((?:[<>=!~]=?|===)[^;]*?)?\s*"
+    r"(?:;\s*(.*?))?\s*$"
+)
+# One comma-separated clause of a specifier: a PEP 440 operator followed by a version
+_SPEC_CLAUSE_RE = re.compile(r"^\s*(?:~=|===|==|!=|<=|>=|<|>)\s*[A-Za-z0-9.*+!_-]+\s*$")
+
+
+def _valid_specifier(spec: str) -> bool:
+    """Return True if every comma-separated clause of *spec* is ``<operator><version>``."""
+    return all(_SPEC_CLAUSE_RE.match(clause) for clause in spec.split(","))
+
+
+def _split_requirement(item: str) -> tuple[str, tuple[str, ...], str | None, str | None] | None:
+    """Split a requirement string into ``(name, extras, specifier, marker)``.
+
+    Uses :data:`_REQ_RE` when the specifier it captures is well formed and otherwise falls
+    back to ``packaging``'s PEP 508 parser. Returns ``None`` for strings neither accepts
+    (e.g. ``foo~1.0`` or ``foo>=1.0,,<2``).
+    """
+    m = _REQ_RE.match(item)
+    if m is not None and (m.group(3) is None or _valid_specifier(m.group(3))):
+        name, extras_raw, spec, marker = m.groups()
+        extras = tuple(sorted(e.strip() for e in (extras_raw or "").split(",") if e.strip()))
+        spec = "".join(spec.split()) if spec else None
+        return name, extras, spec or None, marker or None
+    try:
+        req = Requirement(item)
+    except Exception:
+        return None
+    spec = str(req.specifier) if req.specifier else None
+    marker = str(req.marker) if req.marker else None
+    return req.name, tuple(sorted(req.extras)), spec, marker
+
+
 @dataclass
 class DepRef:
     layout: str  # "poetry" or "pep621"
@@ -227,8 +292,8 @@ class DepRef:
 
 
 def _iter_poetry_deps(doc, groups: Iterable[str]) -> Iterable[DepRef]:
-    tool = doc.setdefault("tool", tomlkit.table())
-    poetry = tool.setdefault("poetry", tomlkit.table())
+    tool = _get_or_create(doc, "tool", tomlkit.table)
+    poetry = _get_or_create(tool, "poetry", tomlkit.table)
 
     def emit_from_table(tbl, group: str):
         if not isinstance(tbl, dict):
@@ -271,7 +336,7 @@ def _iter_poetry_deps(doc, groups: Iterable[str]) -> Iterable[DepRef]:
 
 
 def _iter_pep621_deps(doc, groups: Iterable[str]) -> Iterable[DepRef]:
-    project = doc.setdefault("project", tomlkit.table())
+    project = _get_or_create(doc, "project", tomlkit.table)
     groups_set = set(groups)
 
     def emit_from_array(arr, group: str):
@@ -280,22 +345,21 @@ def _iter_pep621_deps(doc, groups: Iterable[str]) -> Iterable[DepRef]:
         for idx, item in enumerate(list(arr)):
             if not isinstance(item, str):
                 continue
-            try:
-                req = Requirement(item)
-            except Exception:
+            parts = _split_requirement(item)
+            if parts is None:
                 continue
-            spec = str(req.specifier) if req.specifier else None
+            name, extras, spec, marker = parts
             # Keep original text shape; we’ll overwrite the whole string at index
-            yield DepRef("pep621", group, req.name, spec, (arr, idx, req))
+            yield DepRef("pep621", group, name, spec, (arr, idx, name, extras, marker))
 
     # main deps
     if not groups_set or "main" in groups_set:
-        arr = project.setdefault("dependencies", tomlkit.array())
+        arr = _get_or_create(project, "dependencies", tomlkit.array)
         emit = list(emit_from_array(arr, "main"))
         yield from emit
 
     # optional groups
-    opt = project.setdefault("optional-dependencies", tomlkit.table())
+    opt = _get_or_create(project, "optional-dependencies", tomlkit.table)
     if isinstance(opt, dict):
         for gname, arr in opt.items():
             if groups_set and gname not in groups_set:
@@ -317,13 +381,12 @@ def _set_dep_spec(dep: DepRef, new_spec: str):
             else:
                 tbl[key] = new_spec
     else:
-        arr, idx, req = dep.location  # type: ignore[assignment]
+        arr, idx, name, extras, marker = dep.location  # type: ignore[assignment]
         if isinstance(arr, tomlkit.items.Array):
             # Rebuild requirement string with new spec; keep extras/markers
-            name = req.name
-            extras = f"[{','.join(sorted(req.extras))}]" if req.extras else ""
-            markers = f"; {req.marker}" if req.marker else ""
-            arr[idx] = f"{name}{extras} {new_spec}{markers}".strip()
+            extras_str = f"[{','.join(extras)}]" if extras else ""
+            markers = f"; {marker}" if marker else ""
+            arr[idx] = f"{name}{extras_str} {new_spec}{markers}".strip()
 
 
 # ---------- Main upgrade routine ----------
@@ -351,8 +414,12 @@ def upgrade(pyproject: Path, opts: Options) -> int:
 
         # Respect-major check (heuristic against crossing major caps)
         # We perform check after we fetch latest.
-        versions = _fetch_pypi_versions(dep.name, opts.timeout)
-        latest = _select_latest_version(versions, opts.include_prerelease)
+        releases = _fetch_pypi_versions(dep.name, opts.timeout)
+        versions = _parse_versions(
+            (ver_str for ver_str, not_yanked in releases.items() if not_yanked),
+            opts.include_prerelease,
+        )
+        latest = _select_latest_version(versions)
         if latest is None:
             continue
 
@@ -367,16 +434,9 @@ def upgrade(pyproject: Path, opts: Options) -> int:
                 pass
             if target_major is not None:
                 # pick highest < target_major+1.0.0
-                candidates = [Version(v) for v, ok in versions.items() if ok]
-                within = [
-                    v
-                    for v in candidates
-                    if (
-                        v.major == target_major and (opts.include_prerelease or not v.is_prerelease)
-                    )
-                ]
-                if within:
-                    latest = max(within)
+                within = _select_latest_version(versions, major=target_major)
+                if within is not None:
+                    latest = within
 
         # Compute new spec string according to layout/strategy
         if layout == "poetry":
@@ -0,0 +1,40 @@
+"""Optional mypyc-compiled build of greeting_toolkit.
+
+Regular releases are built by Poetry (see pyproject.toml) and are pure Python.
+This script builds platform wheels where the interpreter-heavy CLI and core
+modules are compiled with mypyc; the pure-Python wheel remains the fallback::
+
+    MYPYC_BUILD=1 python setup.py bdist_wheel
+
+Without ``MYPYC_BUILD=1`` nothing is compiled and the result is equivalent to
+the pure-Python wheel. Under PyPy the flag is ignored: C extensions would run
+through the slow cpyext layer and defeat the JIT.
+"""
+
+import os
+import platform
+
+from setuptools import find_packages, setup
+
+# Modules compiled to C extensions when MYPYC_BUILD=1. config.py stays pure
+# Python: its module-level __getattr__ crashes when compiled with mypyc
+MYPYC_MODULES = [
+    "src/greeting_toolkit/cli.py",
+    "src/greeting_toolkit/core.py",
+]
+
+ext_modules = []
+if os.environ.get("MYPYC_BUILD") == "1" and platform.python_implementation() != "PyPy":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(MYPYC_MODULES, opt_level="3")
+
+setup(
+    name="greeting-toolkit",
+    version="0.4.0",
+    package_dir={"": "src"},
+    packages=find_packages("src"),
+    python_requires=">=3.10",
+    entry_points={"console_scripts": ["greeting-toolkit=greeting_toolkit.cli:main"]},
+    ext_modules=ext_modules,
+)
@@ -24,18 +24,22 @@ Examples:
     True
 """
 
-# Import public-facing functions
-from .core import (
-    create_greeting_list,
-    format_greeting,
-    generate_greeting,
-    hello,
-    random_greeting,
-    validate_name,
-)
-
-# Version and author information
-__version__: str = "0.3.0"
+from typing import TYPE_CHECKING
+
+# Version information
+from ._version import __version__
+
+if TYPE_CHECKING:
+    from .core import (
+        create_greeting_list,
+        format_greeting,
+        generate_greeting,
+        hello,
+        random_greeting,
+        validate_name,
+    )
+
+# Author information
 __author__: str = "Diogo Ribeiro"
 
 # Public API
@@ -49,6 +53,27 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> object:
+    """Import the public functions from :mod:`.core` on first access.
+
+    Importing a submodule such as ``greeting_toolkit.cli`` runs this package
+    first, so the core (and its config and JSON modules) is only loaded once
+    one of its functions is actually used.
+    """
+    if name in __all__:
+        from . import core
+
+        value = getattr(core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public functions alongside the module globals."""
+    return sorted({*globals(), *__all__})
+
+
 # Enable CLI usage with python -m greeting_toolkit
 def _main() -> None:
     """Entry point for module execution.
@@ -0,0 +1,3 @@
+"""Version information for greeting_toolkit."""
+
+__version__: str = "0.3.0"
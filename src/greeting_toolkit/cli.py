@@ -1,62 +1,38 @@
 """Command-line interface for greeting_toolkit."""
 
-import argparse
-import json
-import sys
-from pathlib import Path
-from typing import List, Optional
-
-from . import __version__
-from .config import config
-from .core import (
-    add_greeting,
-    create_greeting_list,
-    format_greeting,
-    generate_greeting,
-    get_config,
-    hello,
-    random_greeting,
-    set_default_greeting,
-    set_default_punctuation,
-)
-from .logging import configure_logging, logger
-
+from __future__ import annotations
 
-def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        prog="greeting-toolkit",
-        description="A simple greeting package",
-    )
+import sys
+from collections.abc import Callable
+from functools import cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
 
-    parser.add_argument(
-        "--version", action="version", version=f"%(prog)s {__version__}"
-    )
+from ._version import __version__
+from .logging import configure_logging, logger
 
-    parser.add_argument(
-        "--log-level",
-        choices=["debug", "info", "warning", "error", "critical"],
-        help="Set logging level",
-    )
+if TYPE_CHECKING:
+    import argparse
 
-    parser.add_argument(
-        "--log-file",
-        type=str,
-        help="Path to log file",
-    )
+# Command implementations are imported inside the handler that needs them, so
+# importing this module (or building --help) does not load core or config.
 
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
-    # Basic hello command
+def _add_hello_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``hello`` subcommand."""
     hello_parser = subparsers.add_parser("hello", help="Generate a simple greeting")
     hello_parser.add_argument("name", help="Name to greet")
     hello_parser.add_argument("--greeting", help="Custom greeting")
 
-    # Random greeting command
+
+def _add_random_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``random`` subcommand."""
     random_parser = subparsers.add_parser("random", help="Generate a random greeting")
     random_parser.add_argument("name", help="Name to greet")
 
-    # Time-based greeting command
+
+def _add_time_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``time`` subcommand."""
     time_parser = subparsers.add_parser(
         "time", help="Generate a time-based greeting"
     )
@@ -65,7 +41,9 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "--formal", action="store_true", help="Use formal language"
     )
 
-    # Format greeting command
+
+def _add_format_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``format`` subcommand."""
     format_parser = subparsers.add_parser(
         "format", help="Format a greeting with options"
     )
@@ -83,7 +61,9 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "--max-length", type=int, help="Maximum length (truncates with ...)"
     )
 
-    # Multiple names command
+
+def _add_multi_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``multi`` subcommand."""
     multi_parser = subparsers.add_parser(
         "multi", help="Greet multiple names"
     )
@@ -94,7 +74,9 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "--greeting", default="Hello", help="Custom greeting"
     )
 
-    # Config commands
+
+def _add_config_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the ``config`` subcommand and its nested commands."""
     config_parser = subparsers.add_parser(
         "config", help="Manage configuration"
     )
@@ -137,7 +119,7 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "save", help="Save configuration to file"
     )
     save_parser.add_argument(
-        "path", type=str, help="Path to save configuration"
+        "path", help="Path to save configuration"
     )
 
     # Load config
@@ -145,13 +127,392 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
         "load", help="Load configuration from file"
     )
     load_parser.add_argument(
-        "path", type=str, help="Path to load configuration from"
+        "path", help="Path to load configuration from"
+    )
+
+
+# Subcommand builders, in the order they appear in --help
+_SUBCOMMANDS: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "hello": _add_hello_parser,
+    "random": _add_random_parser,
+    "time": _add_time_parser,
+    "format": _add_format_parser,
+    "multi": _add_multi_parser,
+    "config": _add_config_parser,
+}
+
+# Global options that consume the following argument
+_OPTIONS_WITH_VALUE = frozenset({"--log-level", "--log-file"})
+
+# Flags that need every subcommand registered to produce correct output
+_FULL_PARSER_FLAGS = frozenset({"-h", "--help", "-V", "--version"})
+
+# Answered by main() without building any parser
+_VERSION_FLAGS = frozenset({"-V", "--version"})
+
+
+def _requested_command(args: list[str]) -> str | None:
+    """Find the subcommand named in ``args`` without building any parser.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        The subcommand name, or None when the full parser is required
+        (help/version requested, no command, or an unknown command)
+    """
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+            continue
+        if arg in _FULL_PARSER_FLAGS:
+            return None
+        if arg in _OPTIONS_WITH_VALUE:
+            skip_value = True
+            continue
+        if arg.startswith("-"):
+            continue
+        return arg if arg in _SUBCOMMANDS else None
+    return None
+
+
+@cache
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Parsers are cached per ``command``, so repeated calls in one process
+    (tests, embedding applications) build each one only once.
+
+    Args:
+        command: If given, only this subcommand is registered;
+            otherwise every subcommand is built
+
+    Returns:
+        The configured argument parser
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="greeting-toolkit",
+        description="A simple greeting package",
+    )
+
+    parser.add_argument(
+        "-V", "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+
+    parser.add_argument(
+        "--log-level",
+        choices=["debug", "info", "warning", "error", "critical"],
+        help="Set logging level",
+    )
+
+    parser.add_argument(
+        "--log-file",
+        help="Path to log file",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    if command is None:
+        for add_subparser in _SUBCOMMANDS.values():
+            add_subparser(subparsers)
+    else:
+        _SUBCOMMANDS[command](subparsers)
+
+    return parser
+
+
+# Commands the argv walker handles without argparse:
+# (positional dest, positional takes one-or-more values, {option: (dest, converter)}, defaults).
+# A converter of None marks a store_true flag.
+_FastSpec = tuple[str, bool, dict[str, tuple[str, Callable[[str], Any] | None]], dict[str, Any]]
+_FAST_COMMANDS: dict[str, _FastSpec] = {
+    "hello": ("name", False, {"--greeting": ("greeting", str)}, {"greeting": None}),
+    "random": ("name", False, {}, {}),
+    "time": ("name", False, {"--formal": ("formal", None)}, {"formal": False}),
+    "format": (
+        "name",
+        False,
+        {
+            "--greeting": ("greeting", str),
+            "--punctuation": ("punctuation", str),
+            "--uppercase": ("uppercase", None),
+            "--max-length": ("max_length", int),
+        },
+        {"greeting": "Hello", "punctuation": "!", "uppercase": False, "max_length": None},
+    ),
+    "multi": ("names", True, {"--greeting": ("greeting", str)}, {"greeting": "Hello"}),
+}
+
+
+def _fast_parse(args: list[str]) -> SimpleNamespace | None:
+    """Parse the simple greeting commands without building an argparse parser.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        The parsed arguments, or None if ``args`` need argparse (global options,
+        help, config commands, abbreviations or anything malformed)
+    """
+    if not args or args[0] not in _FAST_COMMANDS:
+        return None
+
+    command = args[0]
+    positional_dest, variadic, options, defaults = _FAST_COMMANDS[command]
+    values: dict[str, Any] = dict(defaults)
+    positionals: list[str] = []
+    # Set once an option interrupts a run of positionals
+    interrupted = False
+
+    i = 1
+    while i < len(args):
+        arg = args[i]
+        if arg.startswith("-"):
+            if arg not in options:
+                return None
+            interrupted = bool(positionals)
+            dest, convert = options[arg]
+            if convert is None:
+                values[dest] = True
+            else:
+                if i + 1 >= len(args) or args[i + 1].startswith("-"):
+                    return None
+                try:
+                    values[dest] = convert(args[i + 1])
+                except ValueError:
+                    return None
+                i += 1
+        else:
+            # argparse consumes a one-or-more positional in a single run, so
+            # values after an option are "unrecognized arguments" there
+            if variadic and interrupted:
+                return None
+            positionals.append(arg)
+        i += 1
+
+    if variadic:
+        if not positionals:
+            return None
+        values[positional_dest] = positionals
+    else:
+        if len(positionals) != 1:
+            return None
+        values[positional_dest] = positionals[0]
+
+    return SimpleNamespace(log_level=None, log_file=None, command=command, **values)
+
+
+def parse_args(
+    args: list[str] | None = None,
+) -> argparse.Namespace | SimpleNamespace:
+    """Parse command line arguments.
+
+    The plain greeting commands are parsed by a small argv walker; argparse is
+    only imported for everything else. In that case only the subparser for the
+    requested command is constructed; the full parser is built for
+    ``--help``/``--version`` or when no known command is given. Errors from
+    the trimmed parser list only the requested command in their usage line.
+    """
+    argv = sys.argv[1:] if args is None else args
+    fast = _fast_parse(argv)
+    if fast is not None:
+        return fast
+    return _build_parser(_requested_command(argv)).parse_args(argv)
+
+
+def _do_hello(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``hello`` command."""
+    from .core import hello
+
+    # Add type checking
+    if not isinstance(parsed_args.name, str):
+        raise TypeError("Name must be a string")
+
+    logger.debug("Running hello command for name: %s", parsed_args.name)
+    print(hello(parsed_args.name, greeting=parsed_args.greeting))
+    return 0
+
+
+def _do_random(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``random`` command."""
+    from .core import random_greeting
+
+    logger.debug("Running random command for name: %s", parsed_args.name)
+    print(random_greeting(parsed_args.name))
+    return 0
+
+
+def _do_time(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``time`` command."""
+    from .core import generate_greeting
+
+    logger.debug("Running time command for name: %s", parsed_args.name)
+    result = generate_greeting(
+        parsed_args.name,
+        formal=parsed_args.formal,
+        time_based=True,
+    )
+    print(result)
+    return 0
+
+
+def _do_format(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``format`` command."""
+    from .core import format_greeting
+
+    logger.debug("Running format command for name: %s", parsed_args.name)
+    result = format_greeting(
+        parsed_args.name,
+        greeting=parsed_args.greeting,
+        punctuation=parsed_args.punctuation,
+        uppercase=parsed_args.uppercase,
+        max_length=parsed_args.max_length,
     )
+    print(result)
+    return 0
+
+
+def _do_multi(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``multi`` command."""
+    from .core import create_greeting_list
+
+    logger.debug("Running multi command for names: %s", parsed_args.names)
+    results = create_greeting_list(
+        parsed_args.names,
+        greeting=parsed_args.greeting,
+    )
+    # One write for the whole batch instead of a print() per line
+    sys.stdout.write("\n".join(results) + "\n")
+    return 0
+
 
-    return parser.parse_args(args)
+def _do_config_show(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``config show`` command."""
+    from .config import _dumps, shared_config
 
+    logger.debug("Running config show command")
+    # Same serialiser as config files (orjson when installed)
+    print(_dumps(shared_config().as_dict()).decode())
+    return 0
+
+
+def _do_config_set(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``config set`` command."""
+    from .config import shared_config
+    from .core import set_default_greeting, set_default_punctuation
+
+    config = shared_config()
+    logger.debug("Running config set command")
+    changed = False
+
+    if parsed_args.greeting is not None:
+        set_default_greeting(parsed_args.greeting)
+        print(f"Default greeting set to: {parsed_args.greeting}")
+        changed = True
 
-def main(args: Optional[List[str]] = None) -> int:
+    if parsed_args.punctuation is not None:
+        set_default_punctuation(parsed_args.punctuation)
+        print(f"Default punctuation set to: {parsed_args.punctuation}")
+        changed = True
+
+    if parsed_args.title is not None:
+        config.formal_title = parsed_args.title
+        print(f"Formal title set to: {parsed_args.title}")
+        changed = True
+
+    if parsed_args.max_name_length is not None:
+        config.max_name_length = parsed_args.max_name_length
+        print(f"Max name length set to: {parsed_args.max_name_length}")
+        changed = True
+
+    if not changed:
+        print("No configuration values were changed.")
+    return 0
+
+
+def _do_config_add_greeting(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``config add-greeting`` command."""
+    from .config import shared_config
+    from .core import add_greeting
+
+    config = shared_config()
+    logger.debug("Adding greeting: %s", parsed_args.greeting)
+    add_greeting(parsed_args.greeting)
+    print(f"Added greeting: {parsed_args.greeting}")
+    print("Available greetings:")
+    for greeting in config.available_greetings:
+        print(f"- {greeting}")
+    return 0
+
+
+def _do_config_save(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``config save`` command."""
+    from pathlib import Path
+
+    from .config import shared_config
+
+    config = shared_config()
+    logger.debug("Saving config to: %s", parsed_args.path)
+    try:
+        config.save_config(Path(parsed_args.path))
+    except (IOError, OSError) as e:
+        print(f"Error saving configuration: {e}")
+        return 1
+    print(f"Configuration saved to: {parsed_args.path}")
+    return 0
+
+
+def _do_config_load(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Run the ``config load`` command."""
+    import json
+    from pathlib import Path
+
+    from .config import shared_config
+
+    config = shared_config()
+    logger.debug("Loading config from: %s", parsed_args.path)
+    try:
+        config.reload(Path(parsed_args.path))
+    except (OSError, json.JSONDecodeError, TypeError, ValueError) as e:
+        print(f"Error loading configuration: {e}")
+        return 1
+    print(f"Configuration loaded from: {parsed_args.path}")
+    return 0
+
+
+# Handlers for the ``config`` subcommands
+_CONFIG_DISPATCH: dict[str, Callable[[argparse.Namespace | SimpleNamespace], int]] = {
+    "show": _do_config_show,
+    "set": _do_config_set,
+    "add-greeting": _do_config_add_greeting,
+    "save": _do_config_save,
+    "load": _do_config_load,
+}
+
+
+def _do_config(parsed_args: argparse.Namespace | SimpleNamespace) -> int:
+    """Dispatch a ``config`` subcommand."""
+    if not parsed_args.config_command:
+        print("Error: Please specify a config command.")
+        return 1
+    return _CONFIG_DISPATCH[parsed_args.config_command](parsed_args)
+
+
+# Handlers for the top-level commands; each returns the exit code
+_DISPATCH: dict[str, Callable[[argparse.Namespace | SimpleNamespace], int]] = {
+    "hello": _do_hello,
+    "random": _do_random,
+    "time": _do_time,
+    "format": _do_format,
+    "multi": _do_multi,
+    "config": _do_config,
+}
+
+
+def main(args: list[str] | None = None) -> int:
     """
     Run the CLI application.
 
@@ -161,7 +522,17 @@ def main(args: Optional[List[str]] = None) -> int:
     Returns:
         Exit code
     """
-    parsed_args = parse_args(args)
+    argv = sys.argv[1:] if args is None else args
+
+    # Answer the trivial invocations before any parsing
+    if not argv:
+        print("Error: Please specify a command.")
+        return 1
+    if len(argv) == 1 and argv[0] in _VERSION_FLAGS:
+        sys.stdout.write(f"greeting-toolkit {__version__}\n")
+        return 0
+
+    parsed_args = parse_args(argv)
 
     # Configure logging if requested
     if parsed_args.log_level or parsed_args.log_file:
@@ -175,126 +546,7 @@ def main(args: Optional[List[str]] = None) -> int:
         print("Error: Please specify a command.")
         return 1
 
-    # Basic greeting commands
-    if parsed_args.command == "hello":
-        # Add type checking
-        if not isinstance(parsed_args.name, str):
-            raise TypeError("Name must be a string")
-
-        logger.debug(f"Running hello command for name: {parsed_args.name}")
-        result = hello(parsed_args.name, greeting=parsed_args.greeting)
-        print(result)
-
-    elif parsed_args.command == "random":
-        logger.debug(f"Running random command for name: {parsed_args.name}")
-        result = random_greeting(parsed_args.name)
-        print(result)
-
-    elif parsed_args.command == "time":
-        logger.debug(f"Running time command for name: {parsed_args.name}")
-        result = generate_greeting(
-            parsed_args.name,
-            formal=parsed_args.formal,
-            time_based=True,
-        )
-        print(result)
-
-    elif parsed_args.command == "format":
-        logger.debug(f"Running format command for name: {parsed_args.name}")
-        result = format_greeting(
-            parsed_args.name,
-            greeting=parsed_args.greeting,
-            punctuation=parsed_args.punctuation,
-            uppercase=parsed_args.uppercase,
-            max_length=parsed_args.max_length,
-        )
-        print(result)
-
-    elif parsed_args.command == "multi":
-        logger.debug(f"Running multi command for names: {parsed_args.names}")
-        results = create_greeting_list(
-            parsed_args.names,
-            greeting=parsed_args.greeting,
-        )
-        for greeting in results:
-            print(greeting)
-
-    # Config commands
-    elif parsed_args.command == "config":
-        if not parsed_args.config_command:
-            print("Error: Please specify a config command.")
-            return 1
-
-        # Show config
-        if parsed_args.config_command == "show":
-            logger.debug("Running config show command")
-            cfg = get_config()
-            print(json.dumps(cfg, indent=2))
-
-        # Set config values
-        elif parsed_args.config_command == "set":
-            logger.debug("Running config set command")
-            changed = False
-
-            if parsed_args.greeting is not None:
-                set_default_greeting(parsed_args.greeting)
-                print(f"Default greeting set to: {parsed_args.greeting}")
-                changed = True
-
-            if parsed_args.punctuation is not None:
-                set_default_punctuation(parsed_args.punctuation)
-                print(f"Default punctuation set to: {parsed_args.punctuation}")
-                changed = True
-
-            if parsed_args.title is not None:
-                config.formal_title = parsed_args.title
-                print(f"Formal title set to: {parsed_args.title}")
-                changed = True
-
-            if parsed_args.max_name_length is not None:
-                config.max_name_length = parsed_args.max_name_length
-                print(f"Max name length set to: {parsed_args.max_name_length}")
-                changed = True
-
-            if not changed:
-                print("No configuration values were changed.")
-
-        # Add greeting
-        elif parsed_args.config_command == "add-greeting":
-            logger.debug(f"Adding greeting: {parsed_args.greeting}")
-            add_greeting(parsed_args.greeting)
-            print(f"Added greeting: {parsed_args.greeting}")
-            print("Available greetings:")
-            for greeting in config.available_greetings:
-                print(f"- {greeting}")
-
-        # Save config
-        elif parsed_args.config_command == "save":
-            logger.debug(f"Saving config to: {parsed_args.path}")
-            try:
-                config.save_config(Path(parsed_args.path))
-                print(f"Configuration saved to: {parsed_args.path}")
-            except (IOError, OSError) as e:
-                print(f"Error saving configuration: {e}")
-                return 1
-
-        # Load config
-        elif parsed_args.config_command == "load":
-            logger.debug(f"Loading config from: {parsed_args.path}")
-            try:
-                new_config = config.__class__(Path(parsed_args.path))
-                # Update global config values
-                config.default_greeting = new_config.default_greeting
-                config.default_punctuation = new_config.default_punctuation
-                config.available_greetings = new_config.available_greetings
-                config.max_name_length = new_config.max_name_length
-                config.formal_title = new_config.formal_title
-                print(f"Configuration loaded from: {parsed_args.path}")
-            except (IOError, OSError, json.JSONDecodeError) as e:
-                print(f"Error loading configuration: {e}")
-                return 1
-
-    return 0
+    return _DISPATCH[parsed_args.command](parsed_args)
 
 
 if __name__ == "__main__":
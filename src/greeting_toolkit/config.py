@@ -1,10 +1,48 @@
 """Configuration module for greeting_toolkit."""
 
+import functools
 import json
 import os
+import sys
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from pathlib import Path
-from typing import Any, cast
+from types import MappingProxyType, ModuleType
+from typing import Any, TypeVar, cast
+
+
+@functools.cache
+def _orjson() -> ModuleType | None:
+    """Return the orjson module, or None to use the standard library's json.
+
+    orjson (the ``speedups`` extra) is imported the first time a config file is
+    read or written rather than with this module. PyPy always uses the standard
+    library, whose pure-Python json is JIT-compiled while orjson goes through
+    slow cpyext.
+    """
+    if sys.implementation.name == "pypy":
+        return None
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return orjson
+
+
+def _loads(data: bytes) -> object:
+    """Decode JSON ``data``."""
+    orjson = _orjson()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps(obj: object) -> bytes:
+    """Serialise ``obj`` to indented JSON bytes."""
+    orjson = _orjson()
+    if orjson is not None:
+        return cast(bytes, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    # Non-ASCII text is written as UTF-8, as orjson does, not as \u escapes
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 # Default configuration
 DEFAULT_CONFIG: dict[str, Any] = {
@@ -24,6 +62,121 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "formal_title": "Mr./Ms. ",
 }
 
+# Decoded config files keyed by path, stamped with (st_mtime_ns, st_size)
+_config_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+
+def _read_config_file(path: Path) -> dict[str, Any]:
+    """Read a JSON config file, reusing the decoded data while the file is unchanged.
+
+    Args:
+        path: Path to the JSON config file
+
+    Returns:
+        The decoded configuration (lists are copied so callers may mutate them)
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+        TypeError: If the file does not contain a JSON object
+    """
+    st = path.stat()
+    key = str(path)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        data = cached[2]
+    else:
+        decoded = _loads(path.read_bytes())
+        if not isinstance(decoded, dict):
+            raise TypeError("Config file must contain a JSON object")
+        data = decoded
+        _config_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in data.items()}
+
+
+_T = TypeVar("_T")
+
+
+def _intern(value: _T) -> _T:
+    """Return the interned copy of a plain ``str``; other values are unchanged.
+
+    Greeting text is reused in every formatted message, so settings share one
+    string object per distinct value.
+    """
+    # An exact type check: sys.intern() raises TypeError for str subclasses
+    if type(value) is str:  # noqa: E721
+        return cast(_T, sys.intern(cast(str, value)))
+    return value
+
+
+# Read-only snapshot used to initialise every Config
+_FROZEN_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        **{key: _intern(value) for key, value in DEFAULT_CONFIG.items()},
+        "available_greetings": tuple(map(_intern, DEFAULT_CONFIG["available_greetings"])),
+    }
+)
+
+
+_STR_TYPES = frozenset({str})
+
+
+def _validate_available_greetings(value: object) -> list[str]:
+    """Check that ``value`` is a list of strings.
+
+    Raises:
+        TypeError: If value is not a list of strings
+    """
+    if not isinstance(value, list):
+        raise TypeError("Available greetings must be a list of strings")
+    # Collect the element types in C; only when something other than plain str
+    # turns up are the (few) distinct types checked in Python
+    types = set(map(type, value))
+    if not (types <= _STR_TYPES or all(issubclass(t, str) for t in types)):
+        raise TypeError("Available greetings must be a list of strings")
+    return list(map(_intern, value))
+
+
+def _validate_max_name_length(value: object) -> int:
+    """Check that ``value`` is a positive integer.
+
+    Raises:
+        TypeError: If value is not an integer
+        ValueError: If value is not positive
+    """
+    if not isinstance(value, int):
+        raise TypeError("Max name length must be an integer")
+    if value <= 0:
+        raise ValueError("Max name length must be a positive integer")
+    return value
+
+
+# Per-setting validators applied on assignment; they return the value to store
+_VALIDATORS: dict[str, Callable[[Any], Any]] = {
+    "default_greeting": _intern,
+    "default_punctuation": _intern,
+    "available_greetings": _validate_available_greetings,
+    "max_name_length": _validate_max_name_length,
+    "formal_title": _intern,
+}
+
+# Names of the user-facing settings, in DEFAULT_CONFIG order
+_CONFIG_KEYS: tuple[str, ...] = tuple(DEFAULT_CONFIG)
+
+
+def _read_validated_values(path: Path) -> dict[str, Any]:
+    """Read a config file and validate its known settings.
+
+    Everything is validated before anything is returned, so callers can apply
+    the result without leaving a config half-updated. Unknown keys are
+    returned unchanged.
+    """
+    user_config = _read_config_file(path)
+    return {
+        key: _VALIDATORS[key](value) if key in _VALIDATORS else value
+        for key, value in user_config.items()
+    }
+
 
 class Config:
     """Configuration handler for greeting_toolkit.
@@ -31,6 +184,17 @@ class Config:
     Manages package configuration with defaults and optional loading from file.
     Configuration can be saved to and loaded from JSON files.
 
+    Settings are plain slot attributes, so reading them is a single attribute
+    lookup. Assignments to ``available_greetings`` and ``max_name_length`` are
+    validated, and string settings are interned.
+
+    Attributes:
+        default_greeting: Greeting used when none is given
+        default_punctuation: Punctuation used when none is given
+        available_greetings: Greetings used for random selection
+        max_name_length: Maximum allowed length for names
+        formal_title: Title prefix used in formal greetings
+
     Examples:
         >>> # Create a config with default values
         >>> cfg = Config()
@@ -42,6 +206,20 @@ class Config:
         >>> cfg.default_greeting
         'Howdy'
 
+        >>> # Validated settings reject bad values
+        >>> try:
+        ...     cfg.available_greetings = [1, 2, 3]  # type: ignore
+        ...     assert False, "Should have raised TypeError"
+        ... except TypeError:
+        ...     True
+        True
+        >>> try:
+        ...     cfg.max_name_length = 0
+        ...     assert False, "Should have raised ValueError"
+        ... except ValueError:
+        ...     True
+        True
+
         >>> # Get full configuration as dictionary
         >>> config_dict = cfg.as_dict()
         >>> isinstance(config_dict, dict)
@@ -50,6 +228,24 @@ class Config:
         True
     """
 
+    __slots__ = (
+        "default_greeting",
+        "default_punctuation",
+        "available_greetings",
+        "max_name_length",
+        "formal_title",
+        "_config_path",
+        "_extra_settings",
+    )
+
+    default_greeting: str
+    default_punctuation: str
+    available_greetings: list[str]
+    max_name_length: int
+    formal_title: str
+    # Keys from the config file that are not settings, kept for as_dict()
+    _extra_settings: dict[str, Any]
+
     def __init__(self, config_path: Path | None = None) -> None:
         """Initialize configuration.
 
@@ -63,7 +259,7 @@ class Config:
             >>> import json
             >>> # Create a temporary config file
             >>> with tempfile.NamedTemporaryFile(mode='w+', delete=False) as tmp:
-            ...     tmp.write('{"default_greeting": "Hola"}')
+            ...     _ = tmp.write('{"default_greeting": "Hola"}')
             ...     tmp_path = tmp.name
             >>>
             >>> # Load config from file
@@ -75,16 +271,29 @@ class Config:
             >>> import os
             >>> os.unlink(tmp_path)
         """
-        self._config: dict[str, Any] = DEFAULT_CONFIG.copy()
+        self._reset_to_defaults()
         self._config_path: Path | None = config_path
         self._load_config()
 
+    def __setattr__(self, name: str, value: object) -> None:
+        """Validate settings that have constraints before storing them.
+
+        Raises:
+            TypeError: If a validated setting gets a value of the wrong type
+            ValueError: If a validated setting gets an out-of-range value
+        """
+        validator = _VALIDATORS.get(name)
+        if validator is not None:
+            value = validator(value)
+        object.__setattr__(self, name, value)
+
     def _load_config(self) -> None:
         """Load configuration from file if exists.
 
         Checks for a configuration file path either from initialization or
         from the GREETING_TOOLKIT_CONFIG environment variable. If a valid
         JSON file is found, its values are merged with the defaults.
+        Unknown keys are kept and included in :meth:`as_dict`.
         """
         # Check environment variable first
         env_config = os.environ.get("GREETING_TOOLKIT_CONFIG")
@@ -93,14 +302,98 @@ class Config:
                 self._config_path = Path(env_config)
 
         # Try loading from file
-        if self._config_path and self._config_path.exists():
+        if self._config_path:
             try:
-                with open(self._config_path) as f:
-                    user_config = json.load(f)
-                    self._config.update(user_config)
-            except (json.JSONDecodeError, OSError):
-                # Fall back to defaults on error
-                pass
+                values = _read_validated_values(self._config_path)
+            except (json.JSONDecodeError, OSError, TypeError, ValueError):
+                # Fall back to defaults on error (including a missing file)
+                return
+            self._apply(values)
+
+    def _reset_to_defaults(self) -> None:
+        """Set every setting to its default value."""
+        # Defaults are known-good, so skip validation
+        for key, value in _FROZEN_DEFAULTS.items():
+            if key == "available_greetings":
+                value = list(value)
+            object.__setattr__(self, key, value)
+        object.__setattr__(self, "_extra_settings", {})
+
+    def _apply(self, values: dict[str, Any]) -> None:
+        """Store already-validated settings without validating them again.
+
+        Keys that are not settings are kept aside, so they survive a save.
+        """
+        extra: dict[str, Any] = self._extra_settings
+        for key, value in values.items():
+            if key in _CONFIG_KEYS:
+                object.__setattr__(self, key, value)
+            else:
+                extra[key] = value
+
+    def add_greeting(self, greeting: str) -> bool:
+        """Append a greeting to ``available_greetings`` unless already present.
+
+        The list is extended in place rather than copied. Membership is
+        checked against the live list, so direct edits to it are always seen.
+
+        Args:
+            greeting: Greeting to add
+
+        Returns:
+            True if the greeting was added, False if it was already present
+
+        Raises:
+            TypeError: If greeting is not a string
+
+        Examples:
+            >>> cfg = Config()
+            >>> cfg.add_greeting("Ahoy")
+            True
+            >>> cfg.add_greeting("Ahoy")
+            False
+            >>> cfg.available_greetings[-1]
+            'Ahoy'
+        """
+        if not isinstance(greeting, str):
+            raise TypeError("Available greetings must be a list of strings")
+        greetings = self.available_greetings
+        if greeting in greetings:
+            return False
+        greetings.append(_intern(greeting))
+        return True
+
+    def reload(self, path: Path) -> None:
+        """Replace the current settings with those from a config file.
+
+        Settings missing from the file are reset to their defaults. Unlike
+        initialization, errors are raised rather than ignored, and the
+        GREETING_TOOLKIT_CONFIG environment variable is not consulted. On
+        error the configuration is left unchanged.
+
+        Args:
+            path: Path to the config file to load
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+            TypeError: If a setting has the wrong type
+            ValueError: If a setting has an invalid value
+
+        Examples:
+            >>> import tempfile
+            >>> cfg = Config()
+            >>> with tempfile.TemporaryDirectory() as tmp_dir:
+            ...     tmp_path = Path(tmp_dir) / "config.json"
+            ...     _ = tmp_path.write_text('{"default_greeting": "Hola"}')
+            ...     cfg.reload(tmp_path)
+            >>> cfg.default_greeting
+            'Hola'
+        """
+        values = _read_validated_values(path)
+        self._reset_to_defaults()
+        self._config_path = path
+        self._apply(values)
 
     def save_config(self, path: Path | None = None) -> None:
         """Save current configuration to file.
@@ -108,6 +401,7 @@ class Config:
         Args:
             path: Path to save config (defaults to current config path)
                 If None, uses the path provided during initialization
+                If neither is set, nothing is written
 
         Raises:
             IOError: If file cannot be written
@@ -135,222 +429,57 @@ class Config:
         """
         save_path: Path | None = path or self._config_path
         if save_path:
-            with open(save_path, "w") as f:
-                json.dump(self._config, f, indent=2)
-
-    @property
-    def default_greeting(self) -> str:
-        """Get default greeting.
-
-        Returns:
-            The configured default greeting
-
-        Examples:
-            >>> cfg = Config()
-            >>> isinstance(cfg.default_greeting, str)
-            True
-        """
-        return cast(str, self._config["default_greeting"])
-
-    @default_greeting.setter
-    def default_greeting(self, value: str) -> None:
-        """Set default greeting.
+            Path(save_path).write_bytes(_dumps(self.as_dict()))
 
-        Args:
-            value: New default greeting
-
-        Examples:
-            >>> cfg = Config()
-            >>> original = cfg.default_greeting
-            >>> cfg.default_greeting = "Aloha"
-            >>> cfg.default_greeting
-            'Aloha'
-            >>> # Reset for other tests
-            >>> cfg.default_greeting = original
-        """
-        self._config["default_greeting"] = value
-
-    @property
-    def default_punctuation(self) -> str:
-        """Get default punctuation.
-
-        Returns:
-            The configured default punctuation
-
-        Examples:
-            >>> cfg = Config()
-            >>> isinstance(cfg.default_punctuation, str)
-            True
-        """
-        return cast(str, self._config["default_punctuation"])
-
-    @default_punctuation.setter
-    def default_punctuation(self, value: str) -> None:
-        """Set default punctuation.
-
-        Args:
-            value: New default punctuation
-
-        Examples:
-            >>> cfg = Config()
-            >>> original = cfg.default_punctuation
-            >>> cfg.default_punctuation = "?"
-            >>> cfg.default_punctuation
-            '?'
-            >>> # Reset for other tests
-            >>> cfg.default_punctuation = original
-        """
-        self._config["default_punctuation"] = value
-
-    @property
-    def available_greetings(self) -> list[str]:
-        """Get available greetings for random selection.
-
-        Returns:
-            List of greeting strings
-
-        Examples:
-            >>> cfg = Config()
-            >>> greetings = cfg.available_greetings
-            >>> isinstance(greetings, list)
-            True
-            >>> len(greetings) > 0
-            True
-            >>> all(isinstance(g, str) for g in greetings)
-            True
-        """
-        return cast(list[str], self._config["available_greetings"])
-
-    @available_greetings.setter
-    def available_greetings(self, value: list[str]) -> None:
-        """Set available greetings.
-
-        Args:
-            value: List of greeting strings
-
-        Raises:
-            TypeError: If value is not a list of strings
-
-        Examples:
-            >>> cfg = Config()
-            >>> original = cfg.available_greetings
-            >>> cfg.available_greetings = ["Hi", "Hello", "Hey"]
-            >>> cfg.available_greetings
-            ['Hi', 'Hello', 'Hey']
-            >>> # Should raise error for non-string list
-            >>> try:
-            ...     cfg.available_greetings = [1, 2, 3]  # type: ignore
-            ...     assert False, "Should have raised TypeError"
-            ... except TypeError:
-            ...     True
-            True
-            >>> # Reset for other tests
-            >>> cfg.available_greetings = original
-        """
-        if not isinstance(value, list) or not all(isinstance(x, str) for x in value):
-            raise TypeError("Available greetings must be a list of strings")
-        self._config["available_greetings"] = value
-
-    @property
-    def max_name_length(self) -> int:
-        """Get maximum name length.
+    def as_dict(self) -> dict[str, Any]:
+        """Get configuration as dictionary.
 
         Returns:
-            Maximum allowed length for names
-
-        Examples:
-            >>> cfg = Config()
-            >>> isinstance(cfg.max_name_length, int)
-            True
-            >>> cfg.max_name_length > 0
-            True
-        """
-        return cast(int, self._config["max_name_length"])
-
-    @max_name_length.setter
-    def max_name_length(self, value: int) -> None:
-        """Set maximum name length.
-
-        Args:
-            value: New maximum length
-
-        Raises:
-            TypeError: If value is not an integer
-            ValueError: If value is not positive
+            A copy of the current configuration, followed by any unknown keys
+            read from the config file
 
         Examples:
             >>> cfg = Config()
-            >>> original = cfg.max_name_length
-            >>> cfg.max_name_length = 100
-            >>> cfg.max_name_length
-            100
-            >>> # Should raise error for non-positive value
-            >>> try:
-            ...     cfg.max_name_length = 0
-            ...     assert False, "Should have raised ValueError"
-            ... except ValueError:
-            ...     True
+            >>> cfg_dict = cfg.as_dict()
+            >>> isinstance(cfg_dict, dict)
             True
-            >>> # Reset for other tests
-            >>> cfg.max_name_length = original
-        """
-        if not isinstance(value, int):
-            raise TypeError("Max name length must be an integer")
-        if value <= 0:
-            raise ValueError("Max name length must be a positive integer")
-        self._config["max_name_length"] = value
-
-    @property
-    def formal_title(self) -> str:
-        """Get formal title prefix.
-
-        Returns:
-            The configured formal title prefix
-
-        Examples:
-            >>> cfg = Config()
-            >>> isinstance(cfg.formal_title, str)
+            >>> sorted(cfg_dict.keys()) == sorted(DEFAULT_CONFIG.keys())
             True
+            >>> # Verify it's a copy, not the live configuration
+            >>> cfg_dict["available_greetings"].append("Yo")
+            >>> "Yo" in cfg.available_greetings
+            False
         """
-        return cast(str, self._config["formal_title"])
+        config_dict = {key: getattr(self, key) for key in _CONFIG_KEYS}
+        config_dict["available_greetings"] = list(self.available_greetings)
+        config_dict.update(self._extra_settings)
+        return config_dict
 
-    @formal_title.setter
-    def formal_title(self, value: str) -> None:
-        """Set formal title prefix.
 
-        Args:
-            value: New formal title prefix
+@functools.cache
+def shared_config() -> Config:
+    """Return the shared configuration, creating it on first use.
 
-        Examples:
-            >>> cfg = Config()
-            >>> original = cfg.formal_title
-            >>> cfg.formal_title = "Dr. "
-            >>> cfg.formal_title
-            'Dr. '
-            >>> # Reset for other tests
-            >>> cfg.formal_title = original
-        """
-        self._config["formal_title"] = value
+    Importing this module does not touch the environment or the file system;
+    the shared instance (and any GREETING_TOOLKIT_CONFIG file) is only read
+    when first needed.
 
-    def as_dict(self) -> dict[str, Any]:
-        """Get configuration as dictionary.
+    Returns:
+        The process-wide Config instance
 
-        Returns:
-            A copy of the current configuration dictionary
+    Examples:
+        >>> shared_config() is shared_config()
+        True
+    """
+    return Config()
 
-        Examples:
-            >>> cfg = Config()
-            >>> cfg_dict = cfg.as_dict()
-            >>> isinstance(cfg_dict, dict)
-            True
-            >>> sorted(cfg_dict.keys()) == sorted(DEFAULT_CONFIG.keys())
-            True
-            >>> # Verify it's a copy, not the original
-            >>> cfg_dict is not cfg._config
-            True
-        """
-        return self._config.copy()
 
+def __getattr__(name: str) -> object:
+    """Provide the shared instance as the ``config`` attribute.
 
-# Global config instance
-config = Config()
+    Keeps ``from greeting_toolkit.config import config`` working without
+    creating the instance at import time.
+    """
+    if name == "config":
+        return shared_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,32 @@
 
 from __future__ import annotations
 
-import re
-import secrets
+import random
+import string
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from .config import config
+from .config import shared_config
+
+# Generator for random_greeting. Picking a greeting is not security sensitive, so
+# the Mersenne Twister is used instead of secrets (which reads os.urandom per call).
+_rng = random.Random()  # noqa: S311  # nosec B311
+
+# Clock used for time-based greetings; tests replace it to pin the hour
+_now = datetime.now
+
+# Time-of-day greeting for each hour 0-23
+_HOUR_GREETING = tuple(
+    "Good morning" if hour < 12 else "Good afternoon" if hour < 18 else "Good evening"
+    for hour in range(24)
+)
+
+# Characters allowed in names besides non-ASCII whitespace (see validate_name)
+_ASCII_WHITESPACE = "".join(c for c in map(chr, range(128)) if c.isspace())
+_NAME_CHARS = string.ascii_letters + _ASCII_WHITESPACE + "-"
+_NAME_CHARS_BYTES = _NAME_CHARS.encode("ascii")
+_NAME_CHARS_DELETE = str.maketrans("", "", _NAME_CHARS)
 
 
 def hello(name: str, greeting: str | None = None) -> str:
@@ -53,7 +73,7 @@ def hello(name: str, greeting: str | None = None) -> str:
     if greeting is not None and not isinstance(greeting, str):
         raise TypeError("Greeting must be a string")
 
-    greeting = greeting or config.default_greeting
+    greeting = greeting or shared_config().default_greeting
     return f"{greeting}, {name}!"
 
 
@@ -89,19 +109,13 @@ def generate_greeting(name: str, formal: bool = False, time_based: bool = False)
         >>> "Mr./Ms." in with_title
         True
     """
-    if time_based:
-        hour = datetime.now().hour
-        if hour < 12:
-            greeting = "Good morning"
-        elif hour < 18:
-            greeting = "Good afternoon"
-        else:
-            greeting = "Good evening"
-    else:
-        greeting = "Good day" if formal else config.default_greeting
+    # Each path reads the shared config at most once
+    if not formal:
+        greeting = _HOUR_GREETING[_now().hour] if time_based else shared_config().default_greeting
+        return f"{greeting}, {name}!"
 
-    title = config.formal_title if formal else ""
-    return f"{greeting}, {title}{name}!"
+    greeting = _HOUR_GREETING[_now().hour] if time_based else "Good day"
+    return f"{greeting}, {shared_config().formal_title}{name}!"
 
 
 def validate_name(name: str) -> tuple[bool, str | None]:
@@ -148,24 +162,41 @@ def validate_name(name: str) -> tuple[bool, str | None]:
         >>> validate_name("John Doe")
         (True, None)
 
-        >>> # Very long name (depends on config.max_name_length)
-        >>> name = "A" * (config.max_name_length + 1)
+        >>> # Very long name (depends on the max_name_length setting)
+        >>> name = "A" * (get_config()["max_name_length"] + 1)
         >>> result, error = validate_name(name)
         >>> result
         False
         >>> "cannot exceed" in error if error else False
         True
     """
+    return _validate_name_cached(name, shared_config().max_name_length)
+
+
+@lru_cache(maxsize=4096)
+def _validate_name_cached(name: str, max_length: int) -> tuple[bool, str | None]:
+    """Validate ``name`` against ``max_length``; see :func:`validate_name`.
+
+    The configured maximum is part of the cache key, so changing it never
+    returns a stale result.
+    """
     if not name:
         return False, "Name cannot be empty"
 
     if len(name) < 2:
         return False, "Name must be at least 2 characters"
 
-    if len(name) > config.max_name_length:
-        return False, f"Name cannot exceed {config.max_name_length} characters"
+    if len(name) > max_length:
+        return False, f"Name cannot exceed {max_length} characters"
 
-    if not re.match(r"^[A-Za-z\s-]+$", name):
+    # Delete every allowed character; a valid name leaves nothing behind, or only
+    # (non-ASCII) whitespace. ASCII names take the faster bytes.translate path.
+    # Both are a single linear pass, so there is no pattern to backtrack on.
+    if name.isascii():
+        invalid = bool(name.encode("ascii").translate(None, _NAME_CHARS_BYTES))
+    else:
+        invalid = not name.translate(_NAME_CHARS_DELETE).isspace()
+    if invalid:
         return False, "Name cannot contain numbers or special characters"
 
     return True, None
@@ -202,15 +233,16 @@ def create_greeting_list(names: list[str], greeting: str | None = None) -> list[
         >>> create_greeting_list(["Charlie"])
         ['Hello, Charlie!']
     """
-    greeting = greeting or config.default_greeting
-    return [f"{greeting}, {name}!" for name in names]
+    # Format the shared prefix once; per name only two pieces are joined
+    prefix = f"{greeting or shared_config().default_greeting}, "
+    return [f"{prefix}{name}!" for name in names]
 
 
 def random_greeting(name: str) -> str:
     """Generate a random greeting from a predefined list.
 
-    Uses :mod:`secrets` for unpredictability; while this is unnecessary for
-    most greetings, it avoids the weaker :mod:`random` module.
+    Uses a module-level :class:`random.Random` instance; the choice does not
+    need to be cryptographically unpredictable.
 
     Args:
         name: The name to greet
@@ -222,15 +254,15 @@ def random_greeting(name: str) -> str:
         >>> greeting = random_greeting("Python")
         >>> "Python" in greeting
         True
-        >>> any(g in greeting for g in config.available_greetings)
+        >>> any(g in greeting for g in get_config()["available_greetings"])
         True
 
         >>> greetings = [random_greeting("Test") for _ in range(10)]
         >>> len(set(greetings)) > 1
         True
     """
-    greetings = config.available_greetings
-    return f"{secrets.choice(greetings)}, {name}!"
+    greetings = shared_config().available_greetings
+    return f"{_rng.choice(greetings)}, {name}!"
 
 
 def format_greeting(
@@ -285,8 +317,10 @@ def format_greeting(
         >>> format_greeting("John", max_length=100)
         'Hello, John!'
     """
-    greeting = greeting or config.default_greeting
-    punctuation = punctuation or config.default_punctuation
+    if not (greeting and punctuation):
+        config = shared_config()
+        greeting = greeting or config.default_greeting
+        punctuation = punctuation or config.default_punctuation
 
     # Build the full greeting first
     result = f"{greeting}, {name}{punctuation}"
@@ -317,11 +351,11 @@ def set_default_greeting(greeting: str) -> None:
 
     Examples:
         >>> # Save original greeting
-        >>> original = config.default_greeting
+        >>> original = get_config()["default_greeting"]
         >>>
         >>> # Set a new greeting
         >>> set_default_greeting("Howdy")
-        >>> config.default_greeting
+        >>> get_config()["default_greeting"]
         'Howdy'
         >>>
         >>> # Verify it's used by default
@@ -331,7 +365,7 @@ def set_default_greeting(greeting: str) -> None:
         >>> # Reset to original
         >>> set_default_greeting(original)
     """
-    config.default_greeting = greeting
+    shared_config().default_greeting = greeting
 
 
 def set_default_punctuation(punctuation: str) -> None:
@@ -342,11 +376,11 @@ def set_default_punctuation(punctuation: str) -> None:
 
     Examples:
         >>> # Save original punctuation
-        >>> original = config.default_punctuation
+        >>> original = get_config()["default_punctuation"]
         >>>
         >>> # Set new punctuation
         >>> set_default_punctuation("?")
-        >>> config.default_punctuation
+        >>> get_config()["default_punctuation"]
         '?'
         >>>
         >>> # Verify it's used by default
@@ -356,7 +390,7 @@ def set_default_punctuation(punctuation: str) -> None:
         >>> # Reset to original
         >>> set_default_punctuation(original)
     """
-    config.default_punctuation = punctuation
+    shared_config().default_punctuation = punctuation
 
 
 def add_greeting(greeting: str) -> None:
@@ -366,34 +400,26 @@ def add_greeting(greeting: str) -> None:
         greeting: Greeting to add
 
     Examples:
-        >>> # Save original greetings
-        >>> original = config.available_greetings.copy()
-        >>>
-        >>> # Add a new greeting
+        >>> # "Greetings" is one of the defaults
+        >>> original = get_config()["available_greetings"]
         >>> add_greeting("Greetings")
-        >>> "Greetings" in config.available_greetings
+        >>> "Greetings" in get_config()["available_greetings"]
         True
         >>>
         >>> # Adding a duplicate does nothing
-        >>> original_length = len(config.available_greetings)
         >>> add_greeting("Greetings")
-        >>> len(config.available_greetings) == original_length
+        >>> get_config()["available_greetings"] == original
         True
-        >>>
-        >>> # Reset to original
-        >>> config.available_greetings = original
     """
-    if greeting not in config.available_greetings:
-        greetings = config.available_greetings.copy()
-        greetings.append(greeting)
-        config.available_greetings = greetings
+    shared_config().add_greeting(greeting)
 
 
 def get_config() -> dict[str, Any]:
     """Get the current configuration.
 
     Returns:
-        Configuration dictionary
+        A copy of the shared configuration as a dictionary; use
+        :func:`greeting_toolkit.config.shared_config` for the live object
 
     Examples:
         >>> # Get configuration
@@ -413,4 +439,4 @@ def get_config() -> dict[str, Any]:
         >>> "formal_title" in cfg
         True
     """
-    return config.as_dict()
+    return shared_config().as_dict()
@@ -1,10 +1,21 @@
-"""Logging configuration for greeting_toolkit."""
+"""Logging configuration for greeting_toolkit.
+
+The package logger only has a :class:`logging.NullHandler` after import.
+Call :func:`configure_logging` (or set ``GREETING_TOOLKIT_LOG_LEVEL`` /
+``GREETING_TOOLKIT_LOG_FILE``) to send its records to the console or a file.
+
+Log calls pass their values as arguments (``logger.debug("name: %s", name)``)
+rather than pre-formatting the message, so nothing is formatted for records
+below the configured level; ruff's ``G`` rules enforce this. Guard arguments
+that are themselves expensive to compute with ``logger.isEnabledFor(level)``.
+"""
 
 import logging
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Literal, overload
+from typing import Any, Literal, overload
 
 # Default log format
 DEFAULT_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -12,6 +23,57 @@ DEFAULT_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Package logger
 logger: logging.Logger = logging.getLogger("greeting_toolkit")
 
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once.
+
+    ``%(asctime)s`` otherwise costs a ``time.strftime`` call per record; here
+    the second-resolution part is reused and only the milliseconds change.
+    """
+
+    _time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(  # noqa: N802
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        """Return the creation time of ``record`` as text."""
+        if datefmt or not self.default_msec_format:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        # Read and replaced as one tuple so concurrent handlers never mix
+        # a second with another second's text
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+# One formatter per format string, shared by every configure_logging() call
+# (building a Formatter parses and validates the format string)
+_FORMATTER_CACHE: dict[str, logging.Formatter] = {}
+
+
+def _get_formatter(format_str: str) -> logging.Formatter:
+    """Return the shared formatter for ``format_str``, creating it on first use."""
+    formatter = _FORMATTER_CACHE.get(format_str)
+    if formatter is None:
+        formatter = _FORMATTER_CACHE[format_str] = _CachedTimeFormatter(format_str)
+    return formatter
+
+
+# Settings and resulting handlers of the last configure_logging() call, used to
+# skip rebuilding handlers when nothing has changed
+_last_config: tuple[Any, ...] | None = None
+_last_handlers: tuple[logging.Handler, ...] = ()
+
+# Level names accepted by configure_logging(), matched case-insensitively;
+# anything else falls back to INFO
+_LEVEL_MAP: dict[str, int] = {
+    name.lower(): getattr(logging, name)
+    for name in ("NOTSET", "DEBUG", "INFO", "WARN", "WARNING", "ERROR", "FATAL", "CRITICAL")
+}
+
 # Type alias for log levels
 LogLevel = int | str | Literal["debug", "info", "warning", "error", "critical"]
 
@@ -22,6 +84,8 @@ def configure_logging(
     format_str: str | None = None,
     log_file: None = None,
     propagate: bool = False,
+    sink: logging.Handler | None = None,
+    formatter: logging.Formatter | None = None,
 ) -> None: ...
 
 
@@ -31,6 +95,8 @@ def configure_logging(
     format_str: str | None = None,
     log_file: str | Path = ...,
     propagate: bool = False,
+    sink: logging.Handler | None = None,
+    formatter: logging.Formatter | None = None,
 ) -> None: ...
 
 
@@ -39,6 +105,8 @@ def configure_logging(
     format_str: str | None = None,
     log_file: str | Path | None = None,
     propagate: bool = False,
+    sink: logging.Handler | None = None,
+    formatter: logging.Formatter | None = None,
 ) -> None:
     """Configure logging for the package.
 
@@ -53,6 +121,12 @@ def configure_logging(
             directory to prevent writing to unexpected locations
         propagate: Whether to propagate to parent loggers
             When True, logs will also be sent to parent loggers
+        sink: Optional handler to use instead of the console handler
+            For example a ``QueueHandler`` that hands records to a listener
+            thread. It gets the same formatter as the other handlers
+        formatter: Optional formatter for all handlers
+            Takes precedence over ``format_str``; by default one shared
+            formatter per format string is used
 
     Examples:
         >>> import tempfile
@@ -73,24 +147,41 @@ def configure_logging(
         >>> len(logger.handlers) > 0  # Ensure handlers are configured
         True
     """
+    global _last_config, _last_handlers
+
     # Convert string level to int if needed
     if isinstance(level, str):
-        level = getattr(logging, level.upper(), logging.INFO)
+        level = _LEVEL_MAP.get(level.lower(), logging.INFO)
+
+    # Level and propagation are cheap to set and may have been changed
+    # directly on the logger since the last call, so always apply them
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+    # Nothing more to do if the same settings were applied last time and the
+    # handlers installed then are still in place
+    settings = (
+        level,
+        formatter or format_str or DEFAULT_FORMAT,
+        os.fspath(log_file) if log_file else None,
+        os.getcwd() if log_file else None,
+        propagate,
+        sink or sys.stdout,
+    )
+    if settings == _last_config and tuple(logger.handlers) == _last_handlers:
+        return
 
     # Set format
-    formatter = logging.Formatter(format_str or DEFAULT_FORMAT)
+    if formatter is None:
+        formatter = _get_formatter(format_str or DEFAULT_FORMAT)
 
     # Clear existing handlers
     logger.handlers.clear()
 
-    # Configure logger
-    logger.setLevel(level)
-    logger.propagate = propagate
-
-    # Add console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Add the sink, or a console handler by default
+    main_handler = sink or logging.StreamHandler(sys.stdout)
+    main_handler.setFormatter(formatter)
+    logger.addHandler(main_handler)
 
     # Add file handler if specified
     if log_file:
@@ -100,14 +191,20 @@ def configure_logging(
             if not file_path.is_relative_to(cwd):
                 raise ValueError("log_file must be within the current working directory")
 
-            if not file_path.parent.exists():
-                file_path.parent.mkdir(parents=True, exist_ok=True)
+            # A single call; exist_ok makes an existing directory a no-op
+            os.makedirs(file_path.parent, exist_ok=True)
 
             file_handler = logging.FileHandler(file_path)
             file_handler.setFormatter(formatter)
             logger.addHandler(file_handler)
         except (OSError, ValueError) as e:
-            logger.warning(f"Failed to configure log file: {e}")
+            logger.warning("Failed to configure log file: %s", e)
+            # Retry the file on the next call rather than skipping it
+            _last_config = None
+            return
+
+    _last_config = settings
+    _last_handlers = tuple(logger.handlers)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -151,6 +248,7 @@ def _configure_from_env() -> None:
         )
 
 
-# Default configuration
-configure_logging()
+# Like any library, stay silent until the application (or the environment)
+# configures logging; configure_logging() installs the real handlers
+logger.addHandler(logging.NullHandler())
 _configure_from_env()
@@ -0,0 +1,70 @@
+"""Shared pytest configuration for the greeting_toolkit tests."""
+
+import io
+import logging
+import sys
+
+import pytest
+
+from greeting_toolkit.logging import logger
+
+# Tracers that are expected while testing: coverage.py (enabled through
+# pytest-cov in addopts) and interactive debuggers
+ALLOWED_TRACER_MODULES = ("coverage", "bdb", "pydevd", "_pydevd", "debugpy")
+
+
+def _tracer_module(tracer):
+    """Return the module a trace function (or tracer object) comes from."""
+    return getattr(tracer, "__module__", None) or type(tracer).__module__
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_stray_trace():
+    """Fail fast if an unexpected trace hook would slow down every test."""
+    tracer = sys.gettrace()
+    if tracer is not None and not _tracer_module(tracer).startswith(ALLOWED_TRACER_MODULES):
+        pytest.fail(f"Unexpected trace function installed: {tracer!r}")
+
+
+# Formatter shared by every log_capture handler
+LOG_CAPTURE_FORMATTER = logging.Formatter("%(levelname)s: %(message)s")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def original_logger_state():
+    """Snapshot the logger's handlers, level and propagation once per session.
+
+    Autouse, so the snapshot is taken before the first test runs rather than
+    when a test first asks for it (by which point earlier tests may have
+    reconfigured the logger).
+    """
+    return tuple(logger.handlers), logger.level, logger.propagate
+
+
+@pytest.fixture()
+def _reset_logger(original_logger_state):
+    """Reset logger to its original state after each test."""
+    yield
+
+    handlers, level, propagate = original_logger_state
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+@pytest.fixture()
+def log_capture(_reset_logger):
+    """Route the package logger into a buffer as ``LEVEL: message`` lines.
+
+    Yields:
+        The ``(buffer, handler)`` pair; the handler is the logger's only one
+    """
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(LOG_CAPTURE_FORMATTER)
+    logger.handlers[:] = [handler]
+    yield buffer, handler
+
+    # _reset_logger restores the original handlers after this teardown
+    logger.removeHandler(handler)
+    handler.close()
@@ -1,24 +1,45 @@
 """Tests for the CLI module."""
 
-from copy import deepcopy
-from io import StringIO
+import json
 from unittest.mock import patch
 
 import pytest
 
-from greeting_toolkit.cli import main, parse_args
+from greeting_toolkit.cli import (
+    _CONFIG_DISPATCH,
+    _DISPATCH,
+    _SUBCOMMANDS,
+    _build_parser,
+    _fast_parse,
+    _requested_command,
+    main,
+    parse_args,
+)
 from greeting_toolkit.config import DEFAULT_CONFIG
 from greeting_toolkit.config import config as global_config
 
-ORIGINAL_DEFAULTS = deepcopy(DEFAULT_CONFIG)
+
+def _snapshot(values):
+    """Copy a config mapping; only the greetings list is mutable."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in values.items()}
+
+
+ORIGINAL_DEFAULTS = _snapshot(DEFAULT_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Full argument parser, built once for the whole session."""
+    return _build_parser()
 
 
 @pytest.fixture(autouse=True)
 def reset_config() -> None:
     yield
     DEFAULT_CONFIG.clear()
-    DEFAULT_CONFIG.update(deepcopy(ORIGINAL_DEFAULTS))
-    global_config._config = deepcopy(ORIGINAL_DEFAULTS)
+    DEFAULT_CONFIG.update(_snapshot(ORIGINAL_DEFAULTS))
+    for key, value in _snapshot(ORIGINAL_DEFAULTS).items():
+        setattr(global_config, key, value)
 
 
 def test_parse_args_hello():
@@ -98,50 +119,140 @@ def test_parse_args_multi():
     assert args.greeting == "Hi"
 
 
-def test_main_no_command():
-    """Test main function with no command."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main([])
-        assert result == 1
-        assert "Error: Please specify a command" in fake_out.getvalue()
+@pytest.mark.parametrize(
+    ("argv", "expected"),
+    [
+        (["hello", "World"], "hello"),
+        (["--log-level", "debug", "multi", "A", "B"], "multi"),
+        (["--log-file=out.log", "config", "show"], "config"),
+        (["hello", "--help"], "hello"),
+        (["--help"], None),
+        (["--version"], None),
+        (["-V"], None),
+        (["unknown"], None),
+        ([], None),
+    ],
+)
+def test_requested_command(argv, expected):
+    """Test detecting the subcommand before any parser is built."""
+    assert _requested_command(argv) == expected
+
+
+def test_build_parser_only_requested_subcommand():
+    """Test that only the requested subparser is constructed."""
+    subparsers = _build_parser("hello")._subparsers._group_actions[0]
+    assert list(subparsers.choices) == ["hello"]
+
+    subparsers = _build_parser()._subparsers._group_actions[0]
+    assert list(subparsers.choices) == ["hello", "random", "time", "format", "multi", "config"]
 
 
 @pytest.mark.parametrize(
-    ("command", "args", "expected_output"),
+    "argv",
     [
-        (
-            "hello",
-            ["World"],
-            "Hello, World!",
-        ),
-        (
-            "hello",
-            ["World", "--greeting", "Hi"],
-            "Hi, World!",
-        ),
-        (
-            "format",
-            ["World", "--uppercase"],
-            "HELLO, WORLD!",
-        ),
-        (
-            "format",
-            ["World", "--max-length", "10"],
-            "Hello, ...",
-        ),
-        (
-            "multi",
-            ["Alice", "Bob"],
-            "Hello, Alice!\nHello, Bob!",
-        ),
+        ["hello", "World"],
+        ["hello", "World", "--greeting", "Hi"],
+        ["hello", "--greeting", "Hi", "World"],
+        ["random", "World"],
+        ["time", "World", "--formal"],
+        ["format", "World", "--uppercase", "--max-length", "10", "--punctuation", "?"],
+        ["multi", "Alice", "Bob", "--greeting", "Hi"],
+        ["multi", "--greeting", "Hi", "Alice", "Bob"],
+    ],
+)
+def test_fast_parse_matches_argparse(parser, argv):
+    """Test that the argv walker produces the same values as argparse."""
+    fast = _fast_parse(argv)
+    assert fast is not None
+    assert vars(fast) == vars(parser.parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--log-level", "debug", "hello", "World"],
+        ["hello", "--help"],
+        ["hello", "World", "--greet", "Hi"],
+        ["hello", "World", "--greeting"],
+        ["hello", "Alice", "Bob"],
+        ["multi"],
+        ["multi", "Alice", "--greeting", "Hi", "Bob"],
+        ["format", "World", "--max-length", "ten"],
+        ["config", "show"],
     ],
 )
-def test_main_commands(command, args, expected_output):
+def test_fast_parse_defers_to_argparse(argv):
+    """Test that anything unusual falls back to argparse."""
+    assert _fast_parse(argv) is None
+
+
+def test_build_parser_is_cached():
+    """Test that each parser variant is only built once."""
+    assert _build_parser() is _build_parser()
+    assert _build_parser("hello") is _build_parser("hello")
+    assert _build_parser("hello") is not _build_parser()
+
+
+def test_dispatch_covers_all_commands():
+    """Test that every parser subcommand has a handler."""
+    assert set(_DISPATCH) == set(_SUBCOMMANDS)
+    parser = _build_parser("config")
+    config_parser = parser._subparsers._group_actions[0].choices["config"]
+    config_choices = config_parser._subparsers._group_actions[0].choices
+    assert set(_CONFIG_DISPATCH) == set(config_choices)
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_main_version_skips_parser(capsys, parser, flag):
+    """Test that --version is answered without building a parser."""
+    with patch("greeting_toolkit.cli._build_parser") as build_parser:
+        assert main([flag]) == 0
+    build_parser.assert_not_called()
+    out = capsys.readouterr().out
+
+    # Same output as argparse's version action
+    with pytest.raises(SystemExit):
+        parser.parse_args([flag])
+    assert out == capsys.readouterr().out
+
+
+def test_main_debug_logging_is_lazy():
+    """Test that debug messages are passed to the logger unformatted."""
+    with patch("greeting_toolkit.cli.logger") as fake_logger:
+        main(["hello", "World"])
+    fake_logger.debug.assert_called_once_with("Running hello command for name: %s", "World")
+
+
+def test_main_no_command(capsys):
+    """Test main function with no command."""
+    result = main([])
+    assert result == 1
+    assert "Error: Please specify a command" in capsys.readouterr().out
+
+
+MAIN_COMMAND_CASES = (
+    (["hello", "World"], "Hello, World!"),
+    (["hello", "World", "--greeting", "Hi"], "Hi, World!"),
+    (["format", "World", "--uppercase"], "HELLO, WORLD!"),
+    (["format", "World", "--max-length", "10"], "Hello, ..."),
+    (["multi", "Alice", "Bob"], "Hello, Alice!\nHello, Bob!"),
+)
+
+
+def test_main_commands(capsys):
     """Test main function with various commands."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main([command] + args)
-        assert result == 0
-        assert expected_output in fake_out.getvalue()
+    for argv, expected_output in MAIN_COMMAND_CASES:
+        result = main(argv)
+        output = capsys.readouterr().out
+        assert result == 0, argv
+        assert expected_output in output, argv
+
+
+def test_main_multi_output_lines(capsys):
+    """Test that multi writes one greeting per line."""
+    assert main(["multi", "Alice", "Bob", "Carol"]) == 0
+    assert capsys.readouterr().out == "Hello, Alice!\nHello, Bob!\nHello, Carol!\n"
 
 
 @pytest.mark.parametrize(
@@ -159,64 +270,80 @@ def test_main_commands(command, args, expected_output):
         ),
     ],
 )
-def test_main_variable_output_commands(command, args, expected_in_output):
+def test_main_variable_output_commands(capsys, command, args, expected_in_output):
     """Test commands with variable output."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main([command] + args)
-        assert result == 0
-        assert expected_in_output in fake_out.getvalue()
+    result = main([command] + args)
+    assert result == 0
+    assert expected_in_output in capsys.readouterr().out
 
 
-def test_main_config_show():
+def test_main_config_show(capsys):
     """Test showing configuration via CLI."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main(["config", "show"])
-        assert result == 0
-        assert "default_greeting" in fake_out.getvalue()
+    result = main(["config", "show"])
+    output = capsys.readouterr().out
+    assert result == 0
+    assert "default_greeting" in output
+    # Output is the indented JSON of the full configuration
+    assert json.loads(output) == global_config.as_dict()
+    assert output == json.dumps(global_config.as_dict(), indent=2) + "\n"
 
 
-def test_main_config_set():
+def test_main_config_set(capsys):
     """Test setting configuration values via CLI."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main(
-            [
-                "config",
-                "set",
-                "--greeting",
-                "Hi",
-                "--punctuation",
-                ".",
-                "--title",
-                "Dr. ",
-                "--max-name-length",
-                "10",
-            ]
-        )
-        output = fake_out.getvalue()
-        assert result == 0
-        assert "Default greeting set to: Hi" in output
-        assert "Default punctuation set to: ." in output
-        assert "Formal title set to: Dr. " in output
-        assert "Max name length set to: 10" in output
-
-
-def test_main_config_add_greeting():
+    result = main(
+        [
+            "config",
+            "set",
+            "--greeting",
+            "Hi",
+            "--punctuation",
+            ".",
+            "--title",
+            "Dr. ",
+            "--max-name-length",
+            "10",
+        ]
+    )
+    output = capsys.readouterr().out
+    assert result == 0
+    assert "Default greeting set to: Hi" in output
+    assert "Default punctuation set to: ." in output
+    assert "Formal title set to: Dr. " in output
+    assert "Max name length set to: 10" in output
+
+
+def test_main_config_add_greeting(capsys):
     """Test adding a greeting via CLI."""
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main(["config", "add-greeting", "Ahoy"])
-        output = fake_out.getvalue()
-        assert result == 0
-        assert "Added greeting: Ahoy" in output
+    result = main(["config", "add-greeting", "Ahoy"])
+    output = capsys.readouterr().out
+    assert result == 0
+    assert "Added greeting: Ahoy" in output
 
 
-def test_main_config_save_and_load(tmp_path):
+def test_main_config_save_and_load(capsys, tmp_path):
     """Test saving and loading configuration via CLI."""
     config_file = tmp_path / "config.json"
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main(["config", "save", str(config_file)])
-        assert result == 0
-        assert config_file.exists()
-    with patch("sys.stdout", new=StringIO()) as fake_out:
-        result = main(["config", "load", str(config_file)])
-        assert result == 0
-        assert "Configuration loaded from" in fake_out.getvalue()
+    result = main(["config", "save", str(config_file)])
+    assert result == 0
+    assert config_file.exists()
+    capsys.readouterr()
+
+    result = main(["config", "load", str(config_file)])
+    assert result == 0
+    assert "Configuration loaded from" in capsys.readouterr().out
+
+
+def test_main_config_load_missing_file(capsys, tmp_path):
+    """Test that loading a missing config file is reported as an error."""
+    result = main(["config", "load", str(tmp_path / "missing.json")])
+    assert result == 1
+    assert "Error loading configuration" in capsys.readouterr().out
+
+
+def test_main_config_load_non_object_file(capsys, tmp_path):
+    """Test that a config file that is not a JSON object is reported as an error."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text("[1, 2]")
+    result = main(["config", "load", str(config_file)])
+    assert result == 1
+    assert "must contain a JSON object" in capsys.readouterr().out
@@ -2,14 +2,26 @@
 
 import json
 import os
-from pathlib import Path
-from tempfile import NamedTemporaryFile, TemporaryDirectory
 from unittest.mock import patch
 
 import pytest
 
 from greeting_toolkit.config import DEFAULT_CONFIG, Config
 
+SAMPLE_CONFIG = {
+    "default_greeting": "Yo",
+    "default_punctuation": "!!",
+    "max_name_length": 25,
+}
+
+
+@pytest.fixture(scope="session")
+def sample_config_path(tmp_path_factory):
+    """Read-only config file with SAMPLE_CONFIG, written once per session."""
+    path = tmp_path_factory.mktemp("config") / "config.json"
+    path.write_text(json.dumps(SAMPLE_CONFIG))
+    return path
+
 
 def test_config_defaults():
     """Test default configuration values."""
@@ -45,6 +57,15 @@ def test_config_setters():
     assert config.max_name_length == 100
 
 
+def test_config_defaults_not_shared():
+    """Test that mutating one config's greetings does not leak into others."""
+    config = Config()
+    config.available_greetings.append("Yo")
+
+    assert "Yo" not in Config().available_greetings
+    assert "Yo" not in DEFAULT_CONFIG["available_greetings"]
+
+
 def test_config_validation():
     """Test configuration validation."""
     config = Config()
@@ -56,6 +77,17 @@ def test_config_validation():
     with pytest.raises(TypeError):
         config.available_greetings = [1, 2, 3]  # Not strings
 
+    with pytest.raises(TypeError):
+        config.available_greetings = ["Hello", None]  # Mixed types
+
+    # Empty lists and str subclasses are accepted
+    class Greeting(str):
+        pass
+
+    config.available_greetings = []
+    config.available_greetings = ["Hello", Greeting("Hi")]
+    assert config.available_greetings == ["Hello", "Hi"]
+
     # Test max_name_length validation
     with pytest.raises(ValueError):
         config.max_name_length = 0
@@ -67,141 +99,253 @@ def test_config_validation():
         config.max_name_length = "not an int"  # type: ignore
 
 
+def test_config_interns_strings():
+    """Test that string settings share one object per distinct value."""
+    config = Config()
+    config.default_greeting = "".join(["Ho", "wdy"])
+    config.available_greetings = ["".join(["Ho", "wdy"]), "Hi"]
+    assert config.default_greeting is config.available_greetings[0]
+    assert Config().formal_title is config.formal_title
+
+
+def test_config_add_greeting():
+    """Test adding greetings in place with duplicate detection."""
+    config = Config()
+    greetings = config.available_greetings
+
+    assert config.add_greeting("Ahoy") is True
+    assert config.add_greeting("Ahoy") is False
+    assert config.add_greeting("Hello") is False
+    assert config.available_greetings is greetings
+    assert greetings.count("Ahoy") == 1
+
+    # Direct edits and replacements of the list are picked up
+    greetings.append("Yo")
+    assert config.add_greeting("Yo") is False
+    config.available_greetings = ["Hi"]
+    assert config.add_greeting("Ahoy") is True
+    assert config.available_greetings == ["Hi", "Ahoy"]
+
+    # So are in-place edits that keep the list's length
+    config.available_greetings[0] = "Yo"
+    assert config.add_greeting("Yo") is False
+    assert config.add_greeting("Hi") is True
+    assert config.available_greetings == ["Yo", "Ahoy", "Hi"]
+
+    with pytest.raises(TypeError):
+        config.add_greeting(42)  # type: ignore
+
+
 def test_config_as_dict():
     """Test converting config to dictionary."""
     config = Config()
     config_dict = config.as_dict()
 
-    # Check it's a copy, not the original
-    assert config_dict is not config._config
+    # Check it's a copy, not the live configuration
+    config_dict["default_greeting"] = "Changed"
+    assert config.default_greeting != "Changed"
 
     # Check values match
-    assert config_dict["default_greeting"] == config.default_greeting
+    assert config.as_dict()["default_greeting"] == config.default_greeting
     assert config_dict["default_punctuation"] == config.default_punctuation
     assert config_dict["available_greetings"] == config.available_greetings
     assert config_dict["max_name_length"] == config.max_name_length
     assert config_dict["formal_title"] == config.formal_title
 
 
-def test_config_load_from_file():
+def test_config_load_from_file(sample_config_path):
     """Test loading configuration from file."""
-    # Create a temporary config file
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        custom_config = {
-            "default_greeting": "Yo",
-            "default_punctuation": "!!",
-            "max_name_length": 25,
-        }
-        json.dump(custom_config, tmp)
-
-    try:
-        # Load config from the file
-        config = Config(Path(tmp.name))
-
-        # Check custom values were loaded
-        assert config.default_greeting == "Yo"
-        assert config.default_punctuation == "!!"
-        assert config.max_name_length == 25
-
-        # Check defaults for values not in file
-        assert config.available_greetings == DEFAULT_CONFIG["available_greetings"]
-        assert config.formal_title == DEFAULT_CONFIG["formal_title"]
-    finally:
-        # Clean up
-        os.unlink(tmp.name)
-
-
-def test_config_load_from_env():
+    config = Config(sample_config_path)
+
+    # File values override the defaults; everything else keeps its default
+    assert config.as_dict() == {**DEFAULT_CONFIG, **SAMPLE_CONFIG}
+
+
+def test_config_load_from_env(sample_config_path):
     """Test loading configuration from environment variable."""
-    # Create a temporary config file
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        custom_config = {
-            "default_greeting": "Sup",
-            "formal_title": "Professor ",
-        }
-        json.dump(custom_config, tmp)
-
-    try:
-        # Set environment variable
-        with patch.dict(os.environ, {"GREETING_TOOLKIT_CONFIG": tmp.name}):
-            config = Config()  # No path provided, should use env var
-
-            # Check custom values were loaded
-            assert config.default_greeting == "Sup"
-            assert config.formal_title == "Professor "
-
-            # Check defaults for values not in file
-            assert config.default_punctuation == DEFAULT_CONFIG["default_punctuation"]
-            assert config.available_greetings == DEFAULT_CONFIG["available_greetings"]
-            assert config.max_name_length == DEFAULT_CONFIG["max_name_length"]
-    finally:
-        # Clean up
-        os.unlink(tmp.name)
-
-
-def test_config_invalid_file():
+    with patch.dict(os.environ, {"GREETING_TOOLKIT_CONFIG": str(sample_config_path)}):
+        config = Config()  # No path provided, should use env var
+
+    # File values override the defaults; everything else keeps its default
+    assert config.as_dict() == {**DEFAULT_CONFIG, **SAMPLE_CONFIG}
+
+
+def test_config_file_cache(tmp_path):
+    """Test that an unchanged config file is only decoded once."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"default_greeting": "Yo"}))
+
+    assert Config(config_path).default_greeting == "Yo"
+    with patch("greeting_toolkit.config._loads") as mock_load:
+        assert Config(config_path).default_greeting == "Yo"
+        mock_load.assert_not_called()
+
+    # A modified file is read again
+    config_path.write_text(json.dumps({"default_greeting": "Howdy"}))
+    assert Config(config_path).default_greeting == "Howdy"
+
+
+def test_config_file_unknown_and_invalid_values(tmp_path):
+    """Test that unknown keys are kept and invalid values fall back to defaults."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"default_greeting": "Yo", "unknown": 1}))
+    config = Config(config_path)
+    assert config.default_greeting == "Yo"
+    assert config.as_dict() == {**DEFAULT_CONFIG, "default_greeting": "Yo", "unknown": 1}
+    assert not hasattr(config, "unknown")
+
+    # Unknown keys are written back on save and dropped by a reload without them
+    saved_path = tmp_path / "saved.json"
+    config.save_config(saved_path)
+    assert json.loads(saved_path.read_text())["unknown"] == 1
+    config.reload(saved_path)
+    assert config.as_dict()["unknown"] == 1
+    saved_path.write_text(json.dumps({"default_greeting": "Yo"}))
+    config.reload(saved_path)
+    assert "unknown" not in config.as_dict()
+
+    config_path.write_text(json.dumps({"default_greeting": "Yo", "max_name_length": -1}))
+    config = Config(config_path)
+    assert config.default_greeting == DEFAULT_CONFIG["default_greeting"]
+    assert config.max_name_length == DEFAULT_CONFIG["max_name_length"]
+
+
+def test_config_reload(tmp_path):
+    """Test reloading configuration in place from a file."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"default_greeting": "Yo"}))
+    other_path = tmp_path / "other.json"
+    other_path.write_text(json.dumps({"default_greeting": "Sup"}))
+
+    config = Config()
+    config.formal_title = "Dr. "
+    with patch.dict(os.environ, {"GREETING_TOOLKIT_CONFIG": str(other_path)}):
+        config.reload(config_path)
+
+    # The explicit path wins and unset values return to their defaults
+    assert config.default_greeting == "Yo"
+    assert config.formal_title == DEFAULT_CONFIG["formal_title"]
+
+
+@pytest.mark.parametrize(
+    ("content", "error"),
+    [
+        (None, OSError),
+        ("This is not valid JSON", json.JSONDecodeError),
+        ("[1, 2]", TypeError),
+        ('"x"', TypeError),
+        (json.dumps({"max_name_length": -1}), ValueError),
+    ],
+)
+def test_config_reload_errors(tmp_path, content, error):
+    """Test that reload raises and leaves the configuration unchanged."""
+    config_path = tmp_path / "config.json"
+    if content is not None:
+        config_path.write_text(content)
+
+    config = Config()
+    config.default_greeting = "Howdy"
+    with pytest.raises(error):
+        config.reload(config_path)
+    assert config.default_greeting == "Howdy"
+
+
+def test_config_invalid_file(tmp_path):
     """Test behavior with invalid config file."""
-    # Create an invalid JSON file
-    with NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-        tmp.write("This is not valid JSON")
-
-    try:
-        # Loading should not raise, should use defaults
-        config = Config(Path(tmp.name))
-
-        # Check all defaults were used
-        assert config.default_greeting == DEFAULT_CONFIG["default_greeting"]
-        assert config.default_punctuation == DEFAULT_CONFIG["default_punctuation"]
-        assert config.available_greetings == DEFAULT_CONFIG["available_greetings"]
-        assert config.max_name_length == DEFAULT_CONFIG["max_name_length"]
-        assert config.formal_title == DEFAULT_CONFIG["formal_title"]
-    finally:
-        # Clean up
-        os.unlink(tmp.name)
-
-
-def test_config_save():
+    config_path = tmp_path / "config.json"
+    config_path.write_text("This is not valid JSON")
+
+    # Loading should not raise, should use defaults
+    config = Config(config_path)
+
+    # Check all defaults were used
+    assert config.default_greeting == DEFAULT_CONFIG["default_greeting"]
+    assert config.default_punctuation == DEFAULT_CONFIG["default_punctuation"]
+    assert config.available_greetings == DEFAULT_CONFIG["available_greetings"]
+    assert config.max_name_length == DEFAULT_CONFIG["max_name_length"]
+    assert config.formal_title == DEFAULT_CONFIG["formal_title"]
+
+
+def test_config_non_object_file(tmp_path):
+    """Test that a config file holding a JSON array falls back to defaults."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text("[1, 2]")
+
+    assert Config(config_path).as_dict() == DEFAULT_CONFIG
+
+
+def test_config_save(tmp_path):
     """Test saving configuration to file."""
-    with TemporaryDirectory() as tmp_dir:
-        config_path = Path(tmp_dir) / "config.json"
+    config_path = tmp_path / "config.json"
 
-        # Create and modify config
-        config = Config()
-        config.default_greeting = "Hola"
-        config.max_name_length = 75
+    # Create and modify config
+    config = Config()
+    config.default_greeting = "Hola"
+    config.max_name_length = 75
 
-        # Save config
-        config.save_config(config_path)
+    # Save config
+    config.save_config(config_path)
 
-        # Check file exists
-        assert config_path.exists()
+    # Check file exists
+    assert config_path.exists()
 
-        # Load and verify
-        with open(config_path) as f:
-            saved_config = json.load(f)
+    # Load and verify
+    saved_config = json.loads(config_path.read_text())
+    assert saved_config["default_greeting"] == "Hola"
+    assert saved_config["max_name_length"] == 75
+    assert saved_config["default_punctuation"] == DEFAULT_CONFIG["default_punctuation"]
 
-        assert saved_config["default_greeting"] == "Hola"
-        assert saved_config["max_name_length"] == 75
-        assert saved_config["default_punctuation"] == DEFAULT_CONFIG["default_punctuation"]
+    # The file holds exactly the current configuration
+    assert saved_config == config.as_dict()
 
 
-def test_config_save_to_current_path():
+def test_config_save_to_current_path(tmp_path):
     """Test saving to the current config path."""
-    with TemporaryDirectory() as tmp_dir:
-        config_path = Path(tmp_dir) / "config.json"
+    config_path = tmp_path / "config.json"
+
+    # Create config with path
+    config = Config(config_path)
+    config.default_greeting = "Bonjour"
+
+    # Save without specifying path
+    config.save_config()
+
+    # Check file exists
+    assert config_path.exists()
+
+    # Verify content
+    saved_config = json.loads(config_path.read_text())
+    assert saved_config["default_greeting"] == "Bonjour"
+    assert saved_config == config.as_dict()
+
+
+def test_config_save_non_ascii(tmp_path):
+    """Test that non-ASCII settings are written as UTF-8 without orjson."""
+    config_path = tmp_path / "config.json"
+
+    config = Config()
+    config.default_greeting = "Olá"
+    with patch("greeting_toolkit.config._orjson", return_value=None):
+        config.save_config(config_path)
+
+    assert "Olá".encode() in config_path.read_bytes()
+    assert Config(config_path).default_greeting == "Olá"
 
-        # Create config with path
-        config = Config(config_path)
-        config.default_greeting = "Bonjour"
 
-        # Save without specifying path
-        config.save_config()
+def test_config_save_without_path(tmp_path, monkeypatch):
+    """Test that saving without any path writes nothing."""
+    monkeypatch.chdir(tmp_path)
+    Config().save_config()
+    assert not any(tmp_path.iterdir())
 
-        # Check file exists
-        assert config_path.exists()
 
-        # Verify content
-        with open(config_path) as f:
-            saved_config = json.load(f)
+def test_shared_config_is_lazy_singleton():
+    """Test that the shared config is created on demand and reused."""
+    import greeting_toolkit.config as config_module
 
-        assert saved_config["default_greeting"] == "Bonjour"
+    # No instance is stored on the module at import time
+    assert "config" not in vars(config_module)
+    assert config_module.shared_config() is config_module.shared_config()
+    assert config_module.config is config_module.shared_config()
+    with pytest.raises(AttributeError):
+        config_module.missing_attribute  # noqa: B018
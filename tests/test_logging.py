@@ -1,140 +1,217 @@
 """Tests for the logging module."""
 
-import io
 import logging
-import os
-import shutil
+import logging.handlers
+import queue
+import runpy
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import greeting_toolkit.logging
 from greeting_toolkit.logging import (
+    DEFAULT_FORMAT,
+    _CachedTimeFormatter,
+    _get_formatter,
     configure_logging,
     get_logger,
     logger,
 )
 
 
-@pytest.fixture
-def reset_logger():
-    """Reset logger to default state after each test."""
-    # Store original handlers and level
-    original_handlers = list(logger.handlers)
-    original_level = logger.level
-    original_propagate = logger.propagate
-
-    yield
-
-    # Reset to original state
-    logger.handlers.clear()
-    for handler in original_handlers:
-        logger.addHandler(handler)
-    logger.setLevel(original_level)
-    logger.propagate = original_propagate
-
-
-def test_default_logger_configuration():
+@pytest.mark.usefixtures("_reset_logger")
+def test_default_logger_configuration(monkeypatch):
     """Test the default logger configuration."""
     # Verify the logger exists and has the correct name
     assert logger.name == "greeting_toolkit"
 
-    # Verify at least one handler is configured (console output)
-    assert len(logger.handlers) > 0
-
-    # Verify at least one StreamHandler is present
-    assert any(isinstance(h, logging.StreamHandler) for h in logger.handlers)
-
-
-def test_configure_logging_level(reset_logger):
+    # Import alone only installs a NullHandler. Other tests configure the
+    # shared logger, so clear it and run the module body again
+    monkeypatch.delenv("GREETING_TOOLKIT_LOG_LEVEL", raising=False)
+    monkeypatch.delenv("GREETING_TOOLKIT_LOG_FILE", raising=False)
+    logger.handlers.clear()
+    namespace = runpy.run_path(greeting_toolkit.logging.__file__)
+    assert namespace["logger"] is logger
+    assert [type(h) for h in logger.handlers] == [logging.NullHandler]
+
+
+@pytest.mark.parametrize(
+    ("level_input", "expected_level"),
+    [
+        (logging.DEBUG, logging.DEBUG),
+        ("error", logging.ERROR),
+        ("invalid", logging.INFO),  # Unknown names default to INFO
+    ],
+)
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_level(level_input, expected_level):
     """Test configuring the logger with different levels."""
-    # Test with integer level
-    configure_logging(level=logging.DEBUG)
-    assert logger.level == logging.DEBUG
-
-    # Test with string level
-    configure_logging(level="error")
-    assert logger.level == logging.ERROR
-
-    # Test with invalid string level (should default to INFO)
-    configure_logging(level="invalid")
-    assert logger.level == logging.INFO
+    configure_logging(level=level_input)
+    assert logger.level == expected_level
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("DEBUG", logging.DEBUG),
+        ("Warning", logging.WARNING),
+        ("warn", logging.WARNING),
+        ("fatal", logging.CRITICAL),
+        ("notset", logging.NOTSET),
+        # Other attributes of the logging module are not levels
+        ("basic_format", logging.INFO),
+        ("root", logging.INFO),
+    ],
+)
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_level_names(name, expected):
+    """Test mapping level names to logging levels."""
+    configure_logging(level=name)
+    assert logger.level == expected
 
 
-def test_configure_logging_format(reset_logger):
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_format():
     """Test configuring the logger with a custom format."""
     # Configure with custom format
     custom_format = "%(levelname)s: %(message)s"
     configure_logging(format_str=custom_format)
 
-    # Verify the format is applied to handlers
+    # Verify the format is applied to handlers through the shared formatter
+    for handler in logger.handlers:
+        assert handler.formatter is _get_formatter(custom_format)
+
+
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_formatter(tmp_path, monkeypatch):
+    """Test that a caller-supplied formatter is used by every handler."""
+    monkeypatch.chdir(tmp_path)
+    sentinel = logging.Formatter("%(levelname)s: %(message)s")
+    configure_logging(format_str="ignored %(message)s", log_file="test.log", formatter=sentinel)
+
+    assert len(logger.handlers) == 2
+    for handler in logger.handlers:
+        assert handler.formatter is sentinel
+
+    # Switching back to a format string rebuilds the handlers
+    configure_logging(format_str="ignored %(message)s", log_file="test.log")
     for handler in logger.handlers:
-        assert handler.formatter is not None
-        assert handler.formatter._fmt == custom_format
+        assert handler.formatter is _get_formatter("ignored %(message)s")
 
 
-def test_configure_logging_propagate(reset_logger):
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, False),  # Default should be no propagation
+        ({"propagate": True}, True),
+    ],
+)
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_propagate(kwargs, expected):
     """Test configuring logger propagation."""
-    # Default should be no propagation
-    configure_logging()
-    assert not logger.propagate
+    configure_logging(**kwargs)
+    assert logger.propagate is expected
+
+
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_skips_identical_reconfigure():
+    """Test that repeating the same configuration keeps the existing handlers."""
+    configure_logging(level="debug")
+    handlers = list(logger.handlers)
+
+    configure_logging(level=logging.DEBUG)
+    assert logger.handlers == handlers
+
+    # Level and propagation changed on the logger directly are re-applied
+    logger.setLevel(logging.ERROR)
+    logger.propagate = True
+    configure_logging(level="debug")
+    assert logger.handlers == handlers
+    assert logger.level == logging.DEBUG
+    assert logger.propagate is False
 
-    # Test with propagation enabled
-    configure_logging(propagate=True)
-    assert logger.propagate
+    # Changed settings rebuild the handlers
+    configure_logging(level="info")
+    assert logger.handlers != handlers
+
+    # So does a handler list that was changed behind our back
+    handlers = list(logger.handlers)
+    logger.handlers.clear()
+    configure_logging(level="info")
+    assert len(logger.handlers) == len(handlers)
 
 
-def test_configure_logging_file(reset_logger):
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_file(tmp_path, monkeypatch):
     """Test configuring logging to a file."""
-    tmp_path = Path("test.log")
+    # Log files must be inside the working directory
+    monkeypatch.chdir(tmp_path)
+    log_file = tmp_path / "test.log"
 
-    try:
-        # Configure with file
-        configure_logging(log_file=tmp_path)
+    # Configure with file
+    configure_logging(log_file=log_file)
 
-        # Verify a FileHandler was added
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-        assert len(file_handlers) > 0
+    # Verify a FileHandler was added
+    file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
+    assert len(file_handlers) > 0
 
-        # Verify the file handler has the correct path
-        for handler in file_handlers:
-            assert Path(handler.baseFilename) == tmp_path.resolve()
+    # Verify the file handler has the correct path
+    for handler in file_handlers:
+        assert Path(handler.baseFilename) == log_file.resolve()
 
-        # Write a log message
-        test_message = "Test log message to file"
-        logger.info(test_message)
 
-        # Verify the message was written to the file
-        content = tmp_path.read_text()
-        assert test_message in content
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_sink():
+    """Test sending records to a custom handler instead of the console."""
+    records = queue.Queue()
+    sink = logging.handlers.QueueHandler(records)
+    configure_logging(format_str="%(levelname)s: %(message)s", sink=sink)
 
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
+    assert logger.handlers == [sink]
+    logger.info("Value: %s", 42)
+    assert records.get_nowait().getMessage() == "INFO: Value: 42"
 
+    # A different sink replaces the handlers
+    other = logging.handlers.QueueHandler(queue.Queue())
+    configure_logging(format_str="%(levelname)s: %(message)s", sink=other)
+    assert logger.handlers == [other]
 
-def test_configure_logging_file_directory_creation(reset_logger):
+
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_file_directory_creation(tmp_path, monkeypatch):
     """Test logging to a file in a non-existent directory."""
+    monkeypatch.chdir(tmp_path)
     log_dir = Path("logs") / "subdir"
     log_file = log_dir / "test.log"
 
-    try:
-        configure_logging(log_file=log_file)
+    configure_logging(log_file=log_file)
+
+    # Verify the directory was created
+    assert log_dir.exists()
+
+    # Write a log message
+    test_message = "Test log message to file in new directory"
+    logger.info(test_message)
+
+    # Verify the message was written
+    assert log_file.exists()
+    assert test_message in log_file.read_text()
+
 
-        # Verify the directory was created
-        assert log_dir.exists()
+def test_cached_time_formatter_matches_standard_formatter():
+    """Test that caching the timestamp does not change formatted output."""
+    standard = logging.Formatter(DEFAULT_FORMAT)
+    cached = _CachedTimeFormatter(DEFAULT_FORMAT)
+    record = logging.LogRecord("greeting_toolkit", logging.INFO, __file__, 1, "msg", None, None)
 
-        # Write a log message
-        test_message = "Test log message to file in new directory"
-        logger.info(test_message)
+    for created in (1_700_000_000.123, 1_700_000_000.456, 1_700_000_001.789):
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        assert cached.format(record) == standard.format(record)
 
-        # Verify the message was written
-        assert log_file.exists()
-        content = log_file.read_text()
-        assert test_message in content
-    finally:
-        if log_dir.parent.exists():
-            shutil.rmtree(log_dir.parent)
+    # An explicit date format bypasses the cache
+    assert cached.formatTime(record, "%Y") == standard.formatTime(record, "%Y")
 
 
 def test_get_logger():
@@ -150,56 +227,57 @@ def test_get_logger():
     assert isinstance(module_logger, logging.Logger)
 
 
-def test_logger_output(reset_logger):
+def test_logger_output(log_capture):
     """Test logger output capture."""
-    # Create a custom handler with a StringIO buffer
-    string_io = io.StringIO()
-    string_handler = logging.StreamHandler(string_io)
-    string_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-
-    # Configure logger with this handler
-    logger.handlers.clear()
-    logger.addHandler(string_handler)
+    buffer, _ = log_capture
     logger.setLevel(logging.INFO)
 
-    # Write a log message
-    test_message = "Test log message"
-    logger.info(test_message)
+    # Write a log message, passing the value as an argument
+    logger.info("Test log message %s", "output")
 
     # Verify the message was output with the correct format
-    output = string_io.getvalue()
-    assert f"INFO: {test_message}" in output
+    assert "INFO: Test log message output" in buffer.getvalue()
 
 
-def test_environment_variable_configuration():
-    """Test configuring logging from environment variables."""
-    # Store original environment
-    original_env = os.environ.copy()
+def test_filtered_log_arguments_are_not_formatted(log_capture):
+    """Test that arguments of records below the logger level are never formatted."""
 
-    try:
-        tmp_path = Path("env.log")
+    class Spy:
+        formatted = False
 
-        from greeting_toolkit.logging import _configure_from_env
+        def __str__(self):
+            Spy.formatted = True
+            return "spy"
+
+    logger.setLevel(logging.INFO)
 
-        os.environ["GREETING_TOOLKIT_LOG_LEVEL"] = "DEBUG"
-        os.environ["GREETING_TOOLKIT_LOG_FILE"] = str(tmp_path)
+    logger.debug("Value: %s", Spy())
+    assert not Spy.formatted
+    assert not logger.isEnabledFor(logging.DEBUG)
 
-        with patch("greeting_toolkit.logging.configure_logging") as mock_configure:
-            _configure_from_env()
+    logger.info("Value: %s", Spy())
+    assert Spy.formatted
+
+
+def test_environment_variable_configuration(monkeypatch, tmp_path):
+    """Test configuring logging from environment variables."""
+    from greeting_toolkit.logging import _configure_from_env
 
-            mock_configure.assert_called_once()
-            args, kwargs = mock_configure.call_args
-            assert kwargs.get("level") == "DEBUG"
-            assert Path(kwargs.get("log_file")) == tmp_path
+    log_file = tmp_path / "env.log"
+    monkeypatch.setenv("GREETING_TOOLKIT_LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("GREETING_TOOLKIT_LOG_FILE", str(log_file))
 
-    finally:
-        if tmp_path.exists():
-            tmp_path.unlink()
-        os.environ.clear()
-        os.environ.update(original_env)
+    with patch("greeting_toolkit.logging.configure_logging") as mock_configure:
+        _configure_from_env()
 
+    mock_configure.assert_called_once()
+    args, kwargs = mock_configure.call_args
+    assert kwargs.get("level") == "DEBUG"
+    assert Path(kwargs.get("log_file")) == log_file
 
-def test_configure_logging_rejects_external_path(reset_logger):
+
+@pytest.mark.usefixtures("_reset_logger")
+def test_configure_logging_rejects_external_path():
     """Logging to paths outside CWD should be ignored."""
     outside = Path("/etc/passwd")
     with patch.object(logger, "warning") as warn:
@@ -209,62 +287,27 @@ def test_configure_logging_rejects_external_path(reset_logger):
     assert not any(isinstance(h, logging.FileHandler) for h in logger.handlers)
 
 
-def test_logging_levels(reset_logger):
-    """Test different logging levels."""
-    # Create a StringIO for capturing output
-    string_io = io.StringIO()
-    string_handler = logging.StreamHandler(string_io)
-    string_handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
-
-    # Clear existing handlers and add our capture handler
-    logger.handlers.clear()
-    logger.addHandler(string_handler)
-
-    # Configure with debug level
-    logger.setLevel(logging.DEBUG)
-
-    # Write messages at different levels
-    debug_msg = "Debug message"
-    info_msg = "Info message"
-    warning_msg = "Warning message"
-    error_msg = "Error message"
-    critical_msg = "Critical message"
-
-    logger.debug(debug_msg)
-    logger.info(info_msg)
-    logger.warning(warning_msg)
-    logger.error(error_msg)
-    logger.critical(critical_msg)
-
-    # Verify all messages were output
-    output = string_io.getvalue()
-    assert f"DEBUG: {debug_msg}" in output
-    assert f"INFO: {info_msg}" in output
-    assert f"WARNING: {warning_msg}" in output
-    assert f"ERROR: {error_msg}" in output
-    assert f"CRITICAL: {critical_msg}" in output
-
-    # Reset for next test
-    string_io.truncate(0)
-    string_io.seek(0)
-
-    # Configure with error level
-    logger.setLevel(logging.ERROR)
-
-    # Write messages at different levels again
-    logger.debug(debug_msg)
-    logger.info(info_msg)
-    logger.warning(warning_msg)
-    logger.error(error_msg)
-    logger.critical(critical_msg)
-
-    # Verify only error and critical messages were output
-    output = string_io.getvalue()
-    assert f"DEBUG: {debug_msg}" not in output
-    assert f"INFO: {info_msg}" not in output
-    assert f"WARNING: {warning_msg}" not in output
-    assert f"ERROR: {error_msg}" in output
-    assert f"CRITICAL: {critical_msg}" in output
+@pytest.mark.parametrize(
+    ("level", "expected_levels"),
+    [
+        (logging.DEBUG, {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}),
+        (logging.ERROR, {"ERROR", "CRITICAL"}),
+    ],
+)
+def test_logging_levels(log_capture, level, expected_levels):
+    """Test that only messages at or above the logger level are emitted."""
+    buffer, _ = log_capture
+    logger.setLevel(level)
+
+    # Write a message at every level
+    logger.debug("Debug message")
+    logger.info("Info message")
+    logger.warning("Warning message")
+    logger.error("Error message")
+    logger.critical("Critical message")
+
+    emitted = {line.split(":", 1)[0] for line in buffer.getvalue().splitlines() if line}
+    assert emitted == expected_levels
 
 
 def test_nested_logger():
@@ -1,13 +1,26 @@
 """Tests for invoking the package as a module."""
 
+import runpy
 import subprocess
 import sys
 
+import pytest
 
-def test_module_execution():
+
+def test_module_execution(monkeypatch, capsys):
     """Running ``python -m greeting_toolkit`` should execute the CLI."""
-    result = subprocess.run(  # noqa: S603
-        [sys.executable, "-m", "greeting_toolkit", "hello", "World"],
+    monkeypatch.setattr(sys, "argv", ["greeting_toolkit", "hello", "World"])
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("greeting_toolkit", run_name="__main__")
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out == "Hello, World!\n"
+
+
+@pytest.mark.slow()
+def test_module_execution_subprocess():
+    """End-to-end check of ``python -m greeting_toolkit`` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-m", "greeting_toolkit", "hello", "World"],  # noqa: S603
         capture_output=True,
         text=True,
         check=True,
@@ -0,0 +1,79 @@
+import sys
+from importlib import util
+from pathlib import Path
+
+import pytest
+from packaging.requirements import Requirement
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Load the script once as a module instead of starting an interpreter for it
+_spec = util.spec_from_file_location("pyproject_updater", ROOT / "scripts" / "pyproject_updater.py")
+pyproject_updater = util.module_from_spec(_spec)
+# Registered first: dataclasses resolves the script's string annotations through sys.modules
+sys.modules[_spec.name] = pyproject_updater
+_spec.loader.exec_module(pyproject_updater)
+
+
+@pytest.mark.parametrize(
+    ("item", "expected"),
+    [
+        ("foo", ("foo", (), None, None)),
+        ("foo>=1.0", ("foo", (), ">=1.0", None)),
+        ("foo ~= 1.2", ("foo", (), "~=1.2", None)),
+        ("foo===1.0", ("foo", (), "===1.0", None)),
+        ("foo==1.*", ("foo", (), "==1.*", None)),
+        ("foo[b, a]>=1.0, <2", ("foo", ("a", "b"), ">=1.0,<2", None)),
+        (
+            'foo>=1.0; python_version < "3.12"',
+            ("foo", (), ">=1.0", 'python_version < "3.12"'),
+        ),
+        (
+            'foo[bar] >=1.0 ; sys_platform == "linux"',
+            ("foo", ("bar",), ">=1.0", 'sys_platform == "linux"'),
+        ),
+    ],
+)
+def test_split_requirement(item, expected):
+    assert pyproject_updater._split_requirement(item) == expected
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        "foo>=1.0,<2",
+        "foo[bar,baz]>=1.0",
+        'foo>=1.0; python_version < "3.12"',
+        "foo (>=1.0)",
+        "foo @ https://example.org/foo-1.0.tar.gz",
+    ],
+)
+def test_split_requirement_matches_packaging(item):
+    """The fast path and the PEP 508 fallback agree on valid requirements."""
+    req = Requirement(item)
+    name, extras, spec, marker = pyproject_updater._split_requirement(item)
+    assert name == req.name
+    assert set(extras) == req.extras
+    assert {str(s) for s in (spec or "").split(",") if s} == {str(s) for s in req.specifier}
+    assert marker == (str(req.marker) if req.marker else None)
+
+
+@pytest.mark.parametrize("item", ["foo~1.0", "foo>=1.0,,<2", "foo>=1.0 extra", "foo>=", "foo=>1"])
+def test_split_requirement_rejects_malformed_specifiers(item):
+    assert pyproject_updater._split_requirement(item) is None
+
+
+@pytest.mark.parametrize(
+    ("include_prerelease", "major", "expected"),
+    [
+        (False, None, "2.1.0"),
+        (True, None, "3.0.0rc1"),
+        (False, 1, "1.10.0"),
+        (False, 4, None),
+    ],
+)
+def test_select_latest_version(include_prerelease, major, expected):
+    versions = ["1.2.0", "1.10.0", "2.1.0", "3.0.0rc1", "not-a-version"]
+    parsed = pyproject_updater._parse_versions(versions, include_prerelease)
+    latest = pyproject_updater._select_latest_version(parsed, major=major)
+    assert latest == (None if expected is None else pyproject_updater.Version(expected))
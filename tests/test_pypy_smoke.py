@@ -0,0 +1,51 @@
+"""Smoke tests for running the package on PyPy as well as CPython."""
+
+import importlib
+import sys
+
+import pytest
+
+from greeting_toolkit import create_greeting_list, hello
+from greeting_toolkit.cli import main
+from greeting_toolkit.config import Config
+
+config_module = importlib.import_module("greeting_toolkit.config")
+
+ON_PYPY = sys.implementation.name == "pypy"
+
+
+def test_core_api_smoke():
+    """Test the pure-Python greeting API end to end."""
+    assert hello("World") == "Hello, World!"
+    assert create_greeting_list(["Alice", "Bob"], greeting="Hi") == [
+        "Hi, Alice!",
+        "Hi, Bob!",
+    ]
+
+
+def test_cli_smoke(capsys):
+    """Test the CLI entry point end to end."""
+    assert main(["hello", "World"]) == 0
+    assert capsys.readouterr().out == "Hello, World!\n"
+
+
+def test_config_round_trip_smoke(tmp_path):
+    """Test that a saved configuration loads back unchanged."""
+    path = tmp_path / "config.json"
+    cfg = Config()
+    cfg.default_greeting = "Howdy"
+    cfg.save_config(path)
+    assert Config(path).as_dict() == cfg.as_dict()
+
+
+@pytest.mark.skipif(not ON_PYPY, reason="PyPy-specific behaviour")
+def test_pypy_uses_stdlib_json():
+    """Test that orjson is never used under PyPy."""
+    assert config_module._orjson() is None
+
+
+@pytest.mark.skipif(not ON_PYPY, reason="PyPy-specific behaviour")
+def test_pypy_runs_pure_python_modules():
+    """Test that no compiled extension modules are loaded under PyPy."""
+    for module in (config_module, sys.modules["greeting_toolkit.cli"]):
+        assert module.__file__.endswith(".py")